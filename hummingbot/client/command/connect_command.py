@@ -92,7 +92,7 @@ class ConnectCommand:
             status = get_connector_status(option)
             if option == "ethereum":
                 eth_address = global_config_map["ethereum_wallet"].value
-                if eth_address is not None and eth_address in Security.private_keys():
+                if eth_address is not None and eth_address in await Security.unlock_wallets([eth_address]):
                     keys_added = "Yes"
                     err_msg = UserBalances.validate_ethereum_wallet()
                     if err_msg is not None:
@@ -136,6 +136,6 @@ class CreateCommand:
     async def update_all_secure_configs(self  # type: HummingbotApplication
                                         ):
         await Security.wait_til_decryption_done()
-        Security.update_config_map(global_config_map)
+        await Security.decrypt_config_map(global_config_map, required_exchanges)
         if self.strategy_config_map is not None:
-            Security.update_config_map(self.strategy_config_map)
+            await Security.decrypt_config_map(self.strategy_config_map)
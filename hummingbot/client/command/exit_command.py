@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 
 import asyncio
+from hummingbot.client.config.security import Security
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.decode_pool import DecodePool
+from hummingbot.core.utils.http_client import HttpClientPool
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -30,5 +33,8 @@ class ExitCommand:
         self._notify("Winding down notifiers...")
         for notifier in self.notifiers:
             notifier.stop()
+        await HttpClientPool.get_instance().close()
+        DecodePool.get_instance().shutdown()
+        Security.shutdown()
 
         self.app.exit()
@@ -35,7 +35,7 @@ class ExportCommand:
         self.placeholder_mode = True
         self.app.hide_input = True
         if await self.check_password():
-            await Security.wait_til_decryption_done()
+            await Security.decrypt_all()
             self._notify("\nWarning: Never disclose API keys or private keys. Anyone with your keys can steal any "
                          "assets held in your account.")
             if Security.all_decrypted_values():
@@ -67,6 +67,8 @@ class ExportCommand:
 
     async def export_trades(self,  # type: HummingbotApplication
                             ):
+        if self.markets_recorder is not None:
+            await self.markets_recorder.wait_for_writes()
         trades: List[TradeFill] = self._get_trades_from_session(int(self.init_time * 1e3))
         if len(trades) == 0:
             self._notify("No past trades to export.")
@@ -3,7 +3,7 @@ import pandas as pd
 import threading
 import time
 from typing import (
-    Set,
+    Dict,
     Tuple,
     TYPE_CHECKING,
     List,
@@ -20,7 +20,12 @@ from hummingbot.client.settings import (
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.user.user_balances import UserBalances
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.client.performance import PerformanceMetrics, calculate_performance_metrics, smart_round
+from hummingbot.client.performance import (
+    PerformanceAccumulator,
+    PerformanceMetrics,
+    accumulate_trades,
+    smart_round,
+)
 
 s_float_0 = float(0)
 s_decimal_0 = Decimal("0")
@@ -49,30 +54,43 @@ class HistoryCommand:
             return
         if global_config_map.get("paper_trade_enabled").value:
             self._notify("\n  Paper Trading ON: All orders are simulated, and no real orders are placed.")
+        safe_ensure_future(self._show_history(days, verbose, precision))
+
+    async def _show_history(self,  # type: HummingbotApplication
+                            days: float,
+                            verbose: bool,
+                            precision: Optional[int]):
+        if self.markets_recorder is not None:
+            await self.markets_recorder.wait_for_writes()
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
-                                                                config_file_path=self.strategy_file_name)
-        if not trades:
+        trades: Optional[List[TradeFill]] = None
+        if self._uses_recorder_performance(start_time):
+            has_trades: bool = any(accumulator.num_trades > 0
+                                   for accumulator in self.get_performance(start_time).values())
+        else:
+            trades = self._get_trades_from_session(int(start_time * 1e3), config_file_path=self.strategy_file_name)
+            has_trades = len(trades) > 0
+        if not has_trades:
             self._notify("\n  No past trades to report.")
             return
         if verbose:
             self.list_trades(start_time)
         if self.strategy_name != "celo_arb":
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            await self.history_report(start_time, trades, precision)
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
+                             trades: Optional[List[TradeFill]],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        performance: Dict[Tuple[str, str], PerformanceAccumulator] = self.get_performance(start_time, trades)
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        # Markets may get their first trade fill while the metrics are being computed.
+        for (market, symbol), accumulator in list(performance.items()):
             cur_balances = await self.get_current_balances(market)
-            perf = await calculate_performance_metrics(market, symbol, cur_trades, cur_balances)
+            perf = await accumulator.performance_metrics(market, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -81,6 +99,24 @@ class HistoryCommand:
             self._notify(f"\nAveraged Return = {avg_return:.2%}")
         return avg_return
 
+    def get_performance(self,  # type: HummingbotApplication
+                        start_time: float,
+                        trades: Optional[List[TradeFill]] = None) -> Dict[Tuple[str, str], PerformanceAccumulator]:
+        """
+        Running trade statistics of the trades since start_time, by market and trading pair. The markets recorder keeps
+        them up to date for the current session; for other periods, they are computed from the trades, which are loaded
+        if not given.
+        """
+        if self._uses_recorder_performance(start_time):
+            return self.markets_recorder.get_performance(self.markets_recorder.session_start)
+        if trades is None:
+            trades = self._get_trades_from_session(int(start_time * 1e3), config_file_path=self.strategy_file_name)
+        return accumulate_trades(trades)
+
+    def _uses_recorder_performance(self,  # type: HummingbotApplication
+                                   start_time: float) -> bool:
+        return self.markets_recorder is not None and start_time == self.init_time
+
     async def get_current_balances(self,  # type: HummingbotApplication
                                    market: str):
         if market in self.markets and self.markets[market].ready:
@@ -198,9 +234,7 @@ class HistoryCommand:
             return s_decimal_0
 
         start_time = self.init_time
-        trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
-                                                                config_file_path=self.strategy_file_name)
-        avg_return = await self.history_report(start_time, trades, display_report=False)
+        avg_return = await self.history_report(start_time, None, display_report=False)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
@@ -22,6 +22,7 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.kill_switch import KillSwitch
 from typing import TYPE_CHECKING
 from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.config.security import Security
 from hummingbot.script.script_iterator import ScriptIterator
 from hummingbot.connector.connector_status import get_connector_status, warning_messages
 from hummingbot.client.config.config_var import ConfigVar
@@ -109,6 +110,9 @@ class StartCommand:
                                   strategy_name: str,
                                   restore: Optional[bool] = False):
         start_strategy: Callable = get_strategy_starter_file(strategy_name)
+        # The connectors read their keys from the config map as they are created, so the keys missing are decrypted
+        # here on the process pool, rather than on the event loop by the strategy start.
+        await Security.decrypt_config_map(global_config_map, settings.required_exchanges)
         if strategy_name in settings.STRATEGIES:
             start_strategy(self)
         else:
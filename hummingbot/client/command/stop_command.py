@@ -4,6 +4,7 @@ import threading
 from typing import TYPE_CHECKING
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication
 
@@ -54,10 +55,15 @@ class StopCommand:
         if self.kill_switch is not None:
             self.kill_switch.stop()
 
+        if self.market_data_recorder is not None:
+            OrderBookTracker.default_market_data_recorder = None
+            self.market_data_recorder.stop()
+
         self.wallet = None
         self.strategy_task = None
         self.strategy = None
         self.market_pair = None
         self.clock = None
         self.markets_recorder = None
+        self.market_data_recorder = None
         self.market_trading_pairs_map.clear()
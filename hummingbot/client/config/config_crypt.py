@@ -62,10 +62,17 @@ def decrypt_config_value(config_key, password):
 
 
 def decrypt_file(file_path, password):
+    return decrypt_key_file(file_path, password).decode()
+
+
+def decrypt_key_file(file_path, password):
+    """
+    Decrypts an encrypted config value or wallet key file. This is where the KDF cost is paid, so it is kept a module
+    level function that can run on a process pool.
+    """
     with open(file_path, 'r') as f:
         encrypted = f.read()
-    secured_value = Account.decrypt(encrypted, password)
-    return secured_value.decode()
+    return Account.decrypt(encrypted, password)
 
 
 def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_factor=None):
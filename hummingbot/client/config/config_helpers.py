@@ -160,7 +160,7 @@ def get_eth_wallet_private_key() -> Optional[str]:
     ethereum_wallet = global_config_map.get("ethereum_wallet").value
     if ethereum_wallet is None or ethereum_wallet == "":
         return None
-    private_key = Security._private_keys[ethereum_wallet]
+    private_key = Security.unlock_wallet(ethereum_wallet)
     account = Account.privateKeyToAccount(private_key)
     return account.privateKey.hex()
 
@@ -290,9 +290,10 @@ async def load_yml_into_cm(yml_path: str, template_file_path: str, cm: Dict[str,
                 logging.getLogger().error(f"Cannot find corresponding config to key {key} in template.")
                 continue
 
-            # Skip this step since the values are not saved in the yml file
+            # Skip this step since the values are not saved in the yml file. Values not decrypted yet are set when
+            # first needed, instead of being decrypted one by one here.
             if cvar.is_secure:
-                cvar.value = Security.decrypted_value(key)
+                cvar.value = Security.cached_value(key)
                 continue
 
             val_in_file = data.get(key)
@@ -464,7 +465,7 @@ def load_all_secure_values(strategy):
 def load_secure_values(config_map):
     for key, config in config_map.items():
         if config.is_secure:
-            config.value = Security.decrypted_value(key)
+            config.value = Security.cached_value(key)
 
 
 def format_config_file_name(file_name):
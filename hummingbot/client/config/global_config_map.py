@@ -266,6 +266,78 @@ main_config_map = {
                   type_str="str",
                   required_if=lambda: global_config_map.get("db_engine").value != "sqlite",
                   default="dbname"),
+    # Trades export options
+    "trades_export_format":
+        ConfigVar(key="trades_export_format",
+                  prompt="Which format do you want trades to be exported in? (csv/parquet) >>> ",
+                  type_str="str",
+                  required_if=lambda: False,
+                  validator=lambda v: None if v in ("csv", "parquet") else "Invalid format, please choose csv or parquet",
+                  default="csv"),
+    "trades_export_max_file_size_mb":
+        ConfigVar(key="trades_export_max_file_size_mb",
+                  prompt="At what size (in MB) do you want the trades export file to be rotated? (0 to disable) >>> ",
+                  type_str="int",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_int(v, min_value=0),
+                  default=0),
+    "trades_export_rotate_daily":
+        ConfigVar(key="trades_export_rotate_daily",
+                  prompt="Do you want to start a new trades export file every day? >>> ",
+                  type_str="bool",
+                  required_if=lambda: False,
+                  validator=validate_bool,
+                  default=False),
+    "market_data_capture_enabled":
+        ConfigVar(key="market_data_capture_enabled",
+                  prompt="Do you want to record the order book messages received, for backtest replays? >>> ",
+                  type_str="bool",
+                  required_if=lambda: False,
+                  validator=validate_bool,
+                  default=False),
+    "http_connection_limit":
+        ConfigVar(key="http_connection_limit",
+                  prompt="How many HTTP connections can be open at once? (0 for no limit) >>> ",
+                  type_str="int",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_int(v, min_value=0),
+                  default=100),
+    "http_connection_limit_per_host":
+        ConfigVar(key="http_connection_limit_per_host",
+                  prompt="How many HTTP connections can be open to one host at once? (0 for no limit) >>> ",
+                  type_str="int",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_int(v, min_value=0),
+                  default=20),
+    "http_dns_cache_ttl":
+        ConfigVar(key="http_dns_cache_ttl",
+                  prompt="For how many seconds do you want DNS lookups to be cached? >>> ",
+                  type_str="int",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_int(v, min_value=0),
+                  default=300),
+    "http_keepalive_timeout":
+        ConfigVar(key="http_keepalive_timeout",
+                  prompt="For how many seconds do you want idle HTTP connections to be kept open? >>> ",
+                  type_str="decimal",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_decimal(v, Decimal(0)),
+                  default=30),
+    "ws_decode_executor":
+        ConfigVar(key="ws_decode_executor",
+                  prompt="Where do you want websocket messages to be decoded? (none/thread/process) >>> ",
+                  type_str="str",
+                  required_if=lambda: False,
+                  validator=lambda v: None if v in ("none", "thread", "process") else
+                  "Invalid executor, please choose none, thread or process",
+                  default="none"),
+    "ws_decode_workers":
+        ConfigVar(key="ws_decode_workers",
+                  prompt="How many threads or processes do you want to decode websocket messages? >>> ",
+                  type_str="int",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_int(v, min_value=1),
+                  default=1),
     "0x_active_cancels":
         ConfigVar(key="0x_active_cancels",
                   prompt="Enable active order cancellations for 0x exchanges (warning: this costs gas)?  >>> ",
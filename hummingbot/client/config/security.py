@@ -1,6 +1,7 @@
 from hummingbot.client.config.config_crypt import (
     list_encrypted_file_paths,
     decrypt_file,
+    decrypt_key_file,
     secure_config_key,
     encrypted_file_exists,
     encrypt_n_save_config_value,
@@ -9,22 +10,34 @@ from hummingbot.client.config.config_crypt import (
 from hummingbot.core.utils.wallet_setup import (
     list_wallets,
     unlock_wallet,
-    import_and_save_wallet
+    import_and_save_wallet,
+    wallet_file_path
 )
 from hummingbot.client.config.global_config_map import global_config_map
-from hummingbot.client.settings import CONNECTOR_SETTINGS
-from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.client.settings import CONNECTOR_SETTINGS, required_exchanges
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from os import unlink
+from typing import Dict, Iterable, List, Optional
 
 
 class Security:
+    """
+    Decrypts the encrypted config values and wallet keys with the password given at login.
+
+    Each decryption pays the deliberately expensive KDF of the key file, so nothing is decrypted up front beyond the
+    password check and the keys of the strategy's exchanges. Other values are decrypted when first used, on a process
+    pool when several are needed at once, and cached for the rest of the session.
+    """
     __instance = None
     password = None
     _secure_configs = {}
     _private_keys = {}
     _decryption_done = asyncio.Event()
+    _decryptions: Dict[str, asyncio.Future] = {}
+    _executor: Optional[ProcessPoolExecutor] = None
 
     @staticmethod
     def new_password_required():
@@ -49,23 +62,33 @@ class Security:
     def login(cls, password):
         encrypted_files = list_encrypted_file_paths()
         wallets = list_wallets()
+        verified_value = verified_private_key = None
         if encrypted_files:
             try:
-                decrypt_file(encrypted_files[0], password)
+                verified_value = decrypt_file(encrypted_files[0], password)
             except ValueError as err:
                 if str(err) == "MAC mismatch":
                     return False
                 raise err
         elif wallets:
             try:
-                unlock_wallet(wallets[0], password)
+                verified_private_key = unlock_wallet(wallets[0], password)
             except ValueError as err:
                 if str(err) == "MAC mismatch":
                     return False
                 raise err
+        if password != Security.password:
+            cls._secure_configs.clear()
+            cls._private_keys.clear()
+            cls._decryptions.clear()
         Security.password = password
-        coro = AsyncCallScheduler.shared_instance().call_async(cls.decrypt_all, timeout_seconds=30)
-        safe_ensure_future(coro)
+        # The password check already paid for one decryption.
+        if verified_value is not None:
+            cls._secure_configs[secure_config_key(encrypted_files[0])] = verified_value
+        elif verified_private_key is not None:
+            cls._private_keys[wallets[0]] = verified_private_key
+        cls._decryption_done.clear()
+        safe_ensure_future(cls.decrypt_required())
         return True
 
     @classmethod
@@ -80,17 +103,138 @@ class Security:
         return cls._private_keys[public_key]
 
     @classmethod
-    def decrypt_all(cls):
-        cls._secure_configs.clear()
-        cls._private_keys.clear()
-        cls._decryption_done.clear()
-        encrypted_files = list_encrypted_file_paths()
-        for file in encrypted_files:
-            cls.decrypt_file(file)
+    async def decrypt_required(cls):
+        """
+        Decrypts the values needed right after login: the keys of the exchanges the strategy uses, the secure global
+        configs of no exchange, and the Ethereum wallet. is_decryption_done() is set once they are.
+        """
+        try:
+            ethereum_wallet = global_config_map.get("ethereum_wallet").value
+            await safe_gather(
+                cls.decrypt_keys(cls.secure_keys(global_config_map, required_exchanges)),
+                cls.unlock_wallets([ethereum_wallet] if ethereum_wallet else [])
+            )
+        finally:
+            cls._decryption_done.set()
+
+    @classmethod
+    async def decrypt_all(cls):
+        await safe_gather(
+            cls.decrypt_keys([secure_config_key(file_path) for file_path in list_encrypted_file_paths()]),
+            cls.unlock_wallets(list_wallets())
+        )
+
+    @classmethod
+    async def decrypt_keys(cls, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Decrypts the config values of the keys that have one, in parallel on the process pool.
+
+        :return: the decrypted values by key
+        """
+        keys = [key for key in keys if key in cls._secure_configs or encrypted_file_exists(key)]
+        values = await safe_gather(*[cls._decrypt_config_value(key) for key in keys])
+        return dict(zip(keys, values))
+
+    @classmethod
+    async def unlock_wallets(cls, public_keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Unlocks the wallets that exist in parallel on the process pool.
+
+        :return: the private keys by public key
+        """
         wallets = list_wallets()
-        for wallet in wallets:
-            cls.unlock_wallet(wallet)
-        cls._decryption_done.set()
+        public_keys = [public_key for public_key in public_keys
+                       if public_key in cls._private_keys or public_key in wallets]
+        private_keys = await safe_gather(*[cls._unlock_wallet(public_key) for public_key in public_keys])
+        return dict(zip(public_keys, private_keys))
+
+    @classmethod
+    async def decrypt_config_map(cls, config_map, exchanges: Optional[Iterable[str]] = None):
+        """
+        Like update_config_map(), with the missing values decrypted on the process pool instead of on the event loop.
+        """
+        await cls.decrypt_keys(key for key in cls.secure_keys(config_map, exchanges) if config_map[key].value is None)
+        cls.update_config_map(config_map, exchanges)
+
+    @staticmethod
+    def secure_keys(config_map, exchanges: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        :return: the keys of the secure configs of the config map, without the keys of the exchanges not listed if
+        exchanges is set
+        """
+        other_exchange_keys = set()
+        if exchanges is not None:
+            exchanges = set(exchanges)
+            used_keys = set()
+            for name, conn_setting in CONNECTOR_SETTINGS.items():
+                (used_keys if name in exchanges else other_exchange_keys).update(conn_setting.config_keys)
+            other_exchange_keys -= used_keys
+        return [key for key, config in config_map.items() if config.is_secure and key not in other_exchange_keys]
+
+    @classmethod
+    def shutdown(cls):
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False)
+            cls._executor = None
+
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ProcessPoolExecutor()
+        return cls._executor
+
+    @classmethod
+    async def _decrypt_on_pool(cls, file_path: str) -> bytes:
+        # Concurrent requests for the same file share one decryption.
+        future = cls._decryptions.get(file_path)
+        if future is None:
+            future = asyncio.get_event_loop().run_in_executor(cls._get_executor(), decrypt_key_file, file_path,
+                                                              cls.password)
+            cls._decryptions[file_path] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if future.done() and cls._decryptions.get(file_path) is future:
+                del cls._decryptions[file_path]
+
+    @classmethod
+    async def _decrypt_config_value(cls, key: str) -> str:
+        if key not in cls._secure_configs:
+            value = (await cls._decrypt_on_pool(encrypted_file_path(key))).decode()
+            # A value updated meanwhile takes precedence.
+            cls._secure_configs.setdefault(key, value)
+        return cls._secure_configs[key]
+
+    @classmethod
+    async def _unlock_wallet(cls, public_key: str) -> str:
+        if public_key not in cls._private_keys:
+            private_key = await cls._decrypt_on_pool(wallet_file_path(public_key))
+            cls._private_keys.setdefault(public_key, private_key)
+        return cls._private_keys[public_key]
+
+    @classmethod
+    def _decrypt_files(cls, file_paths: List[str]) -> List[bytes]:
+        # Blocking, the files are decrypted in parallel when there are several.
+        if len(file_paths) <= 1:
+            return [decrypt_key_file(file_path, cls.password) for file_path in file_paths]
+        return list(cls._get_executor().map(decrypt_key_file, file_paths, repeat(cls.password)))
+
+    @classmethod
+    def _decrypt_missing_values(cls, keys: Iterable[str]):
+        keys = [key for key in keys if key not in cls._secure_configs and encrypted_file_exists(key)]
+        if cls.password is None:
+            return
+        values = cls._decrypt_files([encrypted_file_path(key) for key in keys])
+        for key, value in zip(keys, values):
+            cls._secure_configs[key] = value.decode()
+
+    @classmethod
+    def _unlock_missing_wallets(cls, public_keys: Iterable[str]):
+        public_keys = [public_key for public_key in public_keys if public_key not in cls._private_keys]
+        if cls.password is None:
+            return
+        private_keys = cls._decrypt_files([wallet_file_path(public_key) for public_key in public_keys])
+        cls._private_keys.update(zip(public_keys, private_keys))
 
     @classmethod
     def update_secure_config(cls, key, new_value):
@@ -109,10 +253,15 @@ class Security:
         return account.address
 
     @classmethod
-    def update_config_map(cls, config_map):
-        for config in config_map.values():
-            if config.is_secure and config.value is None:
-                config.value = cls.decrypted_value(config.key)
+    def update_config_map(cls, config_map, exchanges: Optional[Iterable[str]] = None):
+        """
+        Sets the secure configs without a value to their decrypted values. With exchanges set, the keys of the other
+        exchanges are left out, and not decrypted.
+        """
+        keys = [key for key in cls.secure_keys(config_map, exchanges) if config_map[key].value is None]
+        cls._decrypt_missing_values(keys)
+        for key in keys:
+            config_map[key].value = cls._secure_configs.get(key, None)
 
     @classmethod
     def is_decryption_done(cls):
@@ -120,14 +269,24 @@ class Security:
 
     @classmethod
     def decrypted_value(cls, key):
+        cls._decrypt_missing_values([key])
+        return cls._secure_configs.get(key, None)
+
+    @classmethod
+    def cached_value(cls, key):
+        """
+        :return: the value of the key if it has been decrypted already, None otherwise. Nothing is decrypted.
+        """
         return cls._secure_configs.get(key, None)
 
     @classmethod
     def all_decrypted_values(cls):
+        cls._decrypt_missing_values([secure_config_key(file_path) for file_path in list_encrypted_file_paths()])
         return cls._secure_configs.copy()
 
     @classmethod
     def private_keys(cls):
+        cls._unlock_missing_wallets(list_wallets())
         return cls._private_keys.copy()
 
     @classmethod
@@ -137,7 +296,5 @@ class Security:
     @classmethod
     async def api_keys(cls, exchange):
         await cls.wait_til_decryption_done()
-        exchange_configs = [c for c in global_config_map.values()
-                            if c.key in CONNECTOR_SETTINGS[exchange].config_keys and
-                            c.key in cls._secure_configs]
-        return {c.key: cls.decrypted_value(c.key) for c in exchange_configs}
+        return await cls.decrypt_keys(c.key for c in global_config_map.values()
+                                      if c.key in CONNECTOR_SETTINGS[exchange].config_keys)
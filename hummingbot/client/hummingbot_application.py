@@ -3,9 +3,11 @@
 import asyncio
 from collections import deque
 import logging
+from os.path import join
 import time
 from typing import List, Dict, Optional, Tuple, Set, Deque
 
+from hummingbot import data_path
 from hummingbot.client.command import __all__ as commands
 from hummingbot.core.clock import Clock
 from hummingbot.logger import HummingbotLogger
@@ -27,6 +29,8 @@ from hummingbot.client.config.config_helpers import (
 )
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.cross_exchange_market_making import CrossExchangeMarketPair
+from hummingbot.core.utils.decode_pool import DecodePool
+from hummingbot.core.utils.http_client import HttpClientPool
 from hummingbot.core.utils.kill_switch import KillSwitch
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.data_feed.data_feed_base import DataFeedBase
@@ -34,6 +38,8 @@ from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.market_data.market_data_recorder import MarketDataRecorder
 from hummingbot.client.config.security import Security
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorType
@@ -61,6 +67,18 @@ class HummingbotApplication(*commands):
         return cls._main_app
 
     def __init__(self):
+        # The shared HTTP connection pool is configured before any request is made.
+        keepalive_timeout = global_config_map.get("http_keepalive_timeout").value
+        HttpClientPool.get_instance().configure(
+            limit=global_config_map.get("http_connection_limit").value,
+            limit_per_host=global_config_map.get("http_connection_limit_per_host").value,
+            dns_cache_ttl=global_config_map.get("http_dns_cache_ttl").value,
+            keepalive_timeout=float(keepalive_timeout) if keepalive_timeout is not None else None,
+        )
+        DecodePool.get_instance().configure(
+            executor_type=global_config_map.get("ws_decode_executor").value,
+            max_workers=global_config_map.get("ws_decode_workers").value,
+        )
         # This is to start fetching trading pairs for auto-complete
         TradingPairFetcher.get_instance()
         self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
@@ -96,6 +114,7 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.market_data_recorder: Optional[MarketDataRecorder] = None
         self._script_iterator = None
         self._binance_connector = None
 
@@ -203,7 +222,7 @@ class HummingbotApplication(*commands):
         #     self.token_list = get_erc20_token_addresses()
 
         ethereum_wallet = global_config_map.get("ethereum_wallet").value
-        private_key = Security._private_keys[ethereum_wallet]
+        private_key = Security.unlock_wallet(ethereum_wallet)
         ethereum_rpc_url = global_config_map.get("ethereum_rpc_url").value
         erc20_token_addresses = {t: l[0] for t, l in self.token_list.items() if t in token_trading_pairs}
 
@@ -216,6 +235,12 @@ class HummingbotApplication(*commands):
         )
 
     def _initialize_markets(self, market_names: List[Tuple[str, List[str]]]):
+        if global_config_map.get("market_data_capture_enabled").value and self.market_data_recorder is None:
+            # Order book trackers pick up the recorder when they start.
+            self.market_data_recorder = MarketDataRecorder(join(data_path(), "market_data"))
+            self.market_data_recorder.start()
+            OrderBookTracker.default_market_data_recorder = self.market_data_recorder
+
         # aggregate trading_pairs if there are duplicate markets
 
         for market_name, trading_pairs in market_names:
@@ -235,7 +260,7 @@ class HummingbotApplication(*commands):
                 for asset, balance in paper_trade_account_balance.items():
                     connector.set_balance(asset, balance)
             else:
-                Security.update_config_map(global_config_map)
+                Security.update_config_map(global_config_map, [connector_name])
                 keys = {key: config.value for key, config in global_config_map.items()
                         if key in conn_setting.config_keys}
                 init_params = conn_setting.conn_init_parameters(keys)
@@ -259,6 +284,8 @@ class HummingbotApplication(*commands):
             self.strategy_file_name,
             self.strategy_name,
         )
+        # The session of a config carries over restarts, and so do its trade statistics.
+        self.init_time = self.markets_recorder.session_start / 1e3
         self.markets_recorder.start()
 
     def _initialize_notifiers(self):
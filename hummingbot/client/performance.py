@@ -4,6 +4,7 @@ from typing import (
     Dict,
     Optional,
     List,
+    Tuple,
     Any
 )
 from hummingbot.model.trade_fill import TradeFill
@@ -53,64 +54,261 @@ class PerformanceMetrics:
         self.fees: Dict[str, Decimal] = {}
 
 
-def position_order(open: list, close: list):
+class PerformanceAccumulator:
     """
-    Pair open position order with close position orders
-    :param open: a list of orders that may have an open position order
-    :param close: a list of orders that may have an close position order
-    :return: A tuple containing a pair of an open order with a close position order
+    Running trade statistics of one market and trading pair, updated in O(1) per trade, from which the performance
+    metrics are computed without going through the trades again.
+
+    Volumes are summed in trade order, the way a sum over the trades would, so the metrics are the same as for the
+    whole list of trades. For derivatives, fills are aggregated by order, and the open position orders are paired with
+    the close position orders in order: long positions pair open buys with close sells, short positions pair open sells
+    with close buys. The PnL of a pair is updated whenever either order gets another fill.
     """
-    for o in open:
-        for c in close:
-            if o.position == "OPEN" and c.position == "CLOSE":
-                open.remove(o)
-                close.remove(c)
-                return (o, c)
-    return None
 
+    def __init__(self, trading_pair: str):
+        self._trading_pair: str = trading_pair
+        self._base, self._quote = trading_pair.split("-")
+        self._num_buys: int = 0
+        self._num_sells: int = 0
+        self._b_vol_base: Any = 0
+        self._s_vol_base: Any = 0
+        self._b_vol_quote: Any = 0
+        self._s_vol_quote: Any = 0
+        self._start_price: Any = None
+        self._last_price: Any = None
+        # fees is a dictionary of token and total fee amount paid in that token.
+        self._fees: Dict[str, Decimal] = {}
+        # Derivative PnL applies as long as every trade is a TradeFill with a position.
+        self._derivative: bool = True
+        # (trade type, order id) -> [position, price sum, fill count, amount sum, index in its position orders]
+        self._orders: Dict[Tuple[str, str], List[Any]] = {}
+        # The orders of each (trade type, position), in the order of their first fill.
+        self._position_orders: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        self._long_pnls: List[Any] = []
+        self._short_pnls: List[Any] = []
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def num_trades(self) -> int:
+        return self._num_buys + self._num_sells
+
+    def add_trade(self, trade: Any):
+        """
+        :param trade: a TradeFill or Trade object, in trade order
+        """
+        is_buy: bool = trade.trade_type.upper() == "BUY"
+        if is_buy:
+            self._num_buys += 1
+            self._b_vol_base += trade.amount
+            self._b_vol_quote += trade.amount * trade.price
+        else:
+            self._num_sells += 1
+            self._s_vol_base += trade.amount
+            self._s_vol_quote += trade.amount * trade.price
+        if self._start_price is None:
+            self._start_price = trade.price
+        self._last_price = trade.price
 
-def aggregate_position_order(buys: list, sells: list):
-    """
-    Aggregate the amount field for orders with multiple fills
-    :param buys: a list of buy orders
-    :param sells: a list of sell orders
-    :return: 2 lists containing aggregated amounts for buy and sell orders.
-    """
-    aggregated_buys = []
-    aggregated_sells = []
-    for buy in buys:
-        if buy.order_id not in [ag.order_id for ag in aggregated_buys]:
-            aggregate_price = [b.price for b in buys if b.order_id == buy.order_id]
-            aggregate_amount = [b.amount for b in buys if b.order_id == buy.order_id]
-            buy.price = sum(aggregate_price) / len(aggregate_price)
-            buy.amount = sum(aggregate_amount)
-            aggregated_buys.append(buy)
-
-    for sell in sells:
-        if sell.order_id not in [ag.order_id for ag in aggregated_sells]:
-            aggregate_price = [s.price for s in sells if s.order_id == sell.order_id]
-            aggregate_amount = [s.amount for s in sells if s.order_id == sell.order_id]
-            sell.price = sum(aggregate_price) / len(aggregate_price)
-            sell.amount = sum(aggregate_amount)
-            aggregated_sells.append(sell)
-
-    return aggregated_buys, aggregated_sells
-
-
-def derivative_pnl(long: list, short: list):
-    # It is assumed that the amount and leverage for both open and close orders are thesame.
+        if type(trade) is TradeFill:
+            if trade.trade_fee.get("percent") is not None and trade.trade_fee["percent"] > 0:
+                self._add_fee(self._quote, Decimal(trade.price * trade.amount * trade.trade_fee["percent"]))
+            for flat_fee in trade.trade_fee.get("flat_fees", []):
+                self._add_fee(flat_fee["asset"], Decimal(flat_fee["amount"]))
+        else:  # assume this is Trade object
+            if trade.trade_fee.percent > 0:
+                self._add_fee(self._quote, (trade.price * trade.amount) * trade.trade_fee.percent)
+            for flat_fee in trade.trade_fee.flat_fees:
+                self._add_fee(flat_fee[0], flat_fee[1])
+
+        if self._derivative:
+            if type(trade) is not TradeFill or trade.position == "NILL":
+                self._derivative = False
+                self._orders.clear()
+                self._position_orders.clear()
+                self._long_pnls.clear()
+                self._short_pnls.clear()
+            else:
+                self._add_position_fill(trade.trade_type.upper(), trade.order_id, trade.position, trade.price,
+                                        trade.amount)
+
+    def _add_fee(self, token: str, amount: Decimal):
+        if token not in self._fees:
+            self._fees[token] = s_decimal_0
+        self._fees[token] += amount
+
+    def _add_position_fill(self, trade_type: str, order_id: str, position: str, price: Any, amount: Any):
+        key: Tuple[str, str] = (trade_type, order_id)
+        order: Optional[List[Any]] = self._orders.get(key)
+        if order is None:
+            position_orders: List[Tuple[str, str]] = self._position_orders.setdefault((trade_type, position), [])
+            order = [position, 0, 0, 0, len(position_orders)]
+            position_orders.append(key)
+            self._orders[key] = order
+        order[1] += price
+        order[2] += 1
+        order[3] += amount
+        self._update_pair_pnl(trade_type, order)
+
+    def _update_pair_pnl(self, trade_type: str, order: List[Any]):
+        position, index = order[0], order[4]
+        if position == "OPEN":
+            is_long: bool = trade_type == "BUY"
+        elif position == "CLOSE":
+            is_long: bool = trade_type == "SELL"
+        else:
+            return
+        pnls: List[Any] = self._long_pnls if is_long else self._short_pnls
+        open_orders: List[Tuple[str, str]] = self._position_orders.get(("BUY" if is_long else "SELL", "OPEN"), [])
+        close_orders: List[Tuple[str, str]] = self._position_orders.get(("SELL" if is_long else "BUY", "CLOSE"), [])
+        if index >= min(len(open_orders), len(close_orders)):
+            return
+        open_order: List[Any] = self._orders[open_orders[index]]
+        close_order: List[Any] = self._orders[close_orders[index]]
+        open_price = open_order[1] / open_order[2]
+        close_price = close_order[1] / close_order[2]
+        pnl = (close_price - open_price if is_long else open_price - close_price) * close_order[3]
+        # Pairs are made in order, so an order that completes a pair always completes the next one.
+        if index < len(pnls):
+            pnls[index] = pnl
+        else:
+            pnls.append(pnl)
+
+    async def performance_metrics(self, exchange: str, current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
+        """
+        Calculates PnL, fees, Return % and etc... for the trades added so far.
+        :param exchange: the exchange or connector name
+        :param current_balances: current user account balance
+        :return: A PerformanceMetrics object
+        """
+
+        def divide(value, divisor):
+            value = Decimal(str(value))
+            divisor = Decimal(str(divisor))
+            if divisor == s_decimal_0:
+                return s_decimal_0
+            return value / divisor
+
+        base, quote = self._base, self._quote
+        perf = PerformanceMetrics()
+        # Everything is read from the running statistics before the first await, as trades may be added meanwhile.
+        perf.num_buys = self._num_buys
+        perf.num_sells = self._num_sells
+        perf.num_trades = perf.num_buys + perf.num_sells
+
+        perf.b_vol_base = Decimal(str(self._b_vol_base))
+        perf.s_vol_base = Decimal(str(self._s_vol_base)) * Decimal("-1")
+        perf.tot_vol_base = perf.b_vol_base + perf.s_vol_base
+
+        perf.b_vol_quote = Decimal(str(self._b_vol_quote)) * Decimal("-1")
+        perf.s_vol_quote = Decimal(str(self._s_vol_quote))
+        perf.tot_vol_quote = perf.b_vol_quote + perf.s_vol_quote
+
+        perf.avg_b_price = divide(perf.b_vol_quote, perf.b_vol_base)
+        perf.avg_s_price = divide(perf.s_vol_quote, perf.s_vol_base)
+        perf.avg_tot_price = divide(abs(perf.b_vol_quote) + abs(perf.s_vol_quote),
+                                    abs(perf.b_vol_base) + abs(perf.s_vol_base))
+        perf.avg_b_price = abs(perf.avg_b_price)
+        perf.avg_s_price = abs(perf.avg_s_price)
+
+        perf.cur_base_bal = current_balances.get(base, 0)
+        perf.cur_quote_bal = current_balances.get(quote, 0)
+        perf.start_base_bal = perf.cur_base_bal - perf.tot_vol_base
+        perf.start_quote_bal = perf.cur_quote_bal - perf.tot_vol_quote
+
+        derivative: bool = self._derivative and perf.num_trades > 0
+        derivative_pnl = sum(self._long_pnls + self._short_pnls)
+        perf.fees = dict(self._fees)
+        start_price = self._start_price
+        last_price = self._last_price
+
+        perf.cur_price = await get_last_price(exchange.replace("_PaperTrade", ""), self._trading_pair)
+        if perf.cur_price is None:
+            perf.cur_price = Decimal(str(last_price)) if last_price is not None else s_decimal_0
+        perf.start_price = Decimal(str(start_price)) if start_price is not None else perf.cur_price
+        perf.start_base_ratio_pct = divide(perf.start_base_bal * perf.start_price,
+                                           (perf.start_base_bal * perf.start_price) + perf.start_quote_bal)
+        perf.cur_base_ratio_pct = divide(perf.cur_base_bal * perf.cur_price,
+                                         (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal)
+
+        perf.hold_value = (perf.start_base_bal * perf.cur_price) + perf.start_quote_bal
+        perf.cur_value = (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal
+        perf.trade_pnl = perf.cur_value - perf.hold_value
+
+        # Handle trade_pnl differently for derivatives
+        if derivative:
+            perf.trade_pnl = Decimal(str(derivative_pnl))
+
+        for fee_token, fee_amount in perf.fees.items():
+            if fee_token == quote:
+                perf.fee_in_quote += fee_amount
+            else:
+                last_price = await get_last_price(exchange, f"{fee_token}-{quote}")
+                if last_price is not None:
+                    perf.fee_in_quote += fee_amount * last_price
+
+        perf.total_pnl = perf.trade_pnl - perf.fee_in_quote
+        perf.return_pct = divide(perf.total_pnl, perf.hold_value)
+
+        return perf
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        Saved state of the running statistics of TradeFill objects, for PerformanceCheckpoint.
+        """
+        return {
+            "trading_pair": self._trading_pair,
+            "num_buys": self._num_buys,
+            "num_sells": self._num_sells,
+            "b_vol_base": self._b_vol_base,
+            "s_vol_base": self._s_vol_base,
+            "b_vol_quote": self._b_vol_quote,
+            "s_vol_quote": self._s_vol_quote,
+            "start_price": self._start_price,
+            "last_price": self._last_price,
+            "fees": {token: str(amount) for token, amount in self._fees.items()},
+            "derivative": self._derivative,
+            "orders": [[trade_type, order_id] + order[:4] for (trade_type, order_id), order in self._orders.items()],
+        }
+
+    @classmethod
+    def from_json(cls, saved_state: Dict[str, Any]) -> "PerformanceAccumulator":
+        accumulator: PerformanceAccumulator = PerformanceAccumulator(saved_state["trading_pair"])
+        accumulator._num_buys = saved_state["num_buys"]
+        accumulator._num_sells = saved_state["num_sells"]
+        accumulator._b_vol_base = saved_state["b_vol_base"]
+        accumulator._s_vol_base = saved_state["s_vol_base"]
+        accumulator._b_vol_quote = saved_state["b_vol_quote"]
+        accumulator._s_vol_quote = saved_state["s_vol_quote"]
+        accumulator._start_price = saved_state["start_price"]
+        accumulator._last_price = saved_state["last_price"]
+        accumulator._fees = {token: Decimal(amount) for token, amount in saved_state["fees"].items()}
+        accumulator._derivative = saved_state["derivative"]
+        # Orders are restored in the order of their first fill, which rebuilds the same pairs.
+        for trade_type, order_id, position, price_sum, count, amount_sum in saved_state["orders"]:
+            position_orders: List[Tuple[str, str]] = \
+                accumulator._position_orders.setdefault((trade_type, position), [])
+            order: List[Any] = [position, price_sum, count, amount_sum, len(position_orders)]
+            position_orders.append((trade_type, order_id))
+            accumulator._orders[(trade_type, order_id)] = order
+            accumulator._update_pair_pnl(trade_type, order)
+        return accumulator
+
+
+def accumulate_trades(trades: List[Any]) -> Dict[Tuple[str, str], PerformanceAccumulator]:
     """
-    Calculates PnL for a close position
-    :param long: a list containing pairs of open and closed long position orders
-    :param short: a list containing pairs of open and closed short position orders
-    :return: A list containing PnL for each closed positions
+    :param trades: a list of TradeFill objects, in trade order
+    :return: a PerformanceAccumulator of the trades of each market and trading pair
     """
-    pnls = []
-    for lg in long:
-        pnls.append((lg[1].price - lg[0].price) * lg[1].amount)
-    for st in short:
-        pnls.append((st[0].price - st[1].price) * st[1].amount)
-    return pnls
+    accumulators: Dict[Tuple[str, str], PerformanceAccumulator] = {}
+    for trade in trades:
+        key: Tuple[str, str] = (trade.market, trade.symbol)
+        if key not in accumulators:
+            accumulators[key] = PerformanceAccumulator(trade.symbol)
+        accumulators[key].add_trade(trade)
+    return accumulators
 
 
 async def calculate_performance_metrics(exchange: str,
@@ -125,109 +323,10 @@ async def calculate_performance_metrics(exchange: str,
     :param current_balances: current user account balance
     :return: A PerformanceMetrics object
     """
-
-    def divide(value, divisor):
-        value = Decimal(str(value))
-        divisor = Decimal(str(divisor))
-        if divisor == s_decimal_0:
-            return s_decimal_0
-        return value / divisor
-
-    base, quote = trading_pair.split("-")
-    perf = PerformanceMetrics()
-    buys = [t for t in trades if t.trade_type.upper() == "BUY"]
-    sells = [t for t in trades if t.trade_type.upper() == "SELL"]
-    derivative = False
-    if trades and type(trades[0]) == TradeFill and "NILL" not in [t.position for t in trades]:
-        derivative = True
-    perf.num_buys = len(buys)
-    perf.num_sells = len(sells)
-    perf.num_trades = perf.num_buys + perf.num_sells
-
-    perf.b_vol_base = Decimal(str(sum(b.amount for b in buys)))
-    perf.s_vol_base = Decimal(str(sum(s.amount for s in sells))) * Decimal("-1")
-    perf.tot_vol_base = perf.b_vol_base + perf.s_vol_base
-
-    perf.b_vol_quote = Decimal(str(sum(b.amount * b.price for b in buys))) * Decimal("-1")
-    perf.s_vol_quote = Decimal(str(sum(s.amount * s.price for s in sells)))
-    perf.tot_vol_quote = perf.b_vol_quote + perf.s_vol_quote
-
-    perf.avg_b_price = divide(perf.b_vol_quote, perf.b_vol_base)
-    perf.avg_s_price = divide(perf.s_vol_quote, perf.s_vol_base)
-    perf.avg_tot_price = divide(abs(perf.b_vol_quote) + abs(perf.s_vol_quote),
-                                abs(perf.b_vol_base) + abs(perf.s_vol_base))
-    perf.avg_b_price = abs(perf.avg_b_price)
-    perf.avg_s_price = abs(perf.avg_s_price)
-
-    perf.cur_base_bal = current_balances.get(base, 0)
-    perf.cur_quote_bal = current_balances.get(quote, 0)
-    perf.start_base_bal = perf.cur_base_bal - perf.tot_vol_base
-    perf.start_quote_bal = perf.cur_quote_bal - perf.tot_vol_quote
-
-    perf.start_price = Decimal(str(trades[0].price))
-    perf.cur_price = await get_last_price(exchange.replace("_PaperTrade", ""), trading_pair)
-    if perf.cur_price is None:
-        perf.cur_price = Decimal(str(trades[-1].price))
-    perf.start_base_ratio_pct = divide(perf.start_base_bal * perf.start_price,
-                                       (perf.start_base_bal * perf.start_price) + perf.start_quote_bal)
-    perf.cur_base_ratio_pct = divide(perf.cur_base_bal * perf.cur_price,
-                                     (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal)
-
-    perf.hold_value = (perf.start_base_bal * perf.cur_price) + perf.start_quote_bal
-    perf.cur_value = (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal
-    perf.trade_pnl = perf.cur_value - perf.hold_value
-
-    # Handle trade_pnl differently for derivatives
-    if derivative:
-        buys_copy, sells_copy = aggregate_position_order(buys.copy(), sells.copy())
-        long = []
-        short = []
-
-        while True:
-            lng = position_order(buys_copy, sells_copy)
-            if lng is not None:
-                long.append(lng)
-
-            sht = position_order(sells_copy, buys_copy)
-            if sht is not None:
-                short.append(sht)
-            if lng is None and sht is None:
-                break
-
-        perf.trade_pnl = Decimal(str(sum(derivative_pnl(long, short))))
-
+    accumulator: PerformanceAccumulator = PerformanceAccumulator(trading_pair)
     for trade in trades:
-        if type(trade) is TradeFill:
-            if trade.trade_fee.get("percent") is not None and trade.trade_fee["percent"] > 0:
-                if quote not in perf.fees:
-                    perf.fees[quote] = s_decimal_0
-                perf.fees[quote] += Decimal(trade.price * trade.amount * trade.trade_fee["percent"])
-            for flat_fee in trade.trade_fee.get("flat_fees", []):
-                if flat_fee["asset"] not in perf.fees:
-                    perf.fees[flat_fee["asset"]] = s_decimal_0
-                perf.fees[flat_fee["asset"]] += Decimal(flat_fee["amount"])
-        else:  # assume this is Trade object
-            if trade.trade_fee.percent > 0:
-                if quote not in perf.fees:
-                    perf.fees[quote] = s_decimal_0
-                perf.fees[quote] += (trade.price * trade.order_amount) * trade.trade_fee.percent
-            for flat_fee in trade.trade_fee.flat_fees:
-                if flat_fee[0] not in perf.fees:
-                    perf.fees[flat_fee[0]] = s_decimal_0
-                perf.fees[flat_fee[0]] += flat_fee[1]
-
-    for fee_token, fee_amount in perf.fees.items():
-        if fee_token == quote:
-            perf.fee_in_quote += fee_amount
-        else:
-            last_price = await get_last_price(exchange, f"{fee_token}-{quote}")
-            if last_price is not None:
-                perf.fee_in_quote += fee_amount * last_price
-
-    perf.total_pnl = perf.trade_pnl - perf.fee_in_quote
-    perf.return_pct = divide(perf.total_pnl, perf.hold_value)
-
-    return perf
+        accumulator.add_trade(trade)
+    return await accumulator.performance_metrics(exchange, current_balances)
 
 
 def smart_round(value: Decimal, precision: Optional[int] = None) -> Decimal:
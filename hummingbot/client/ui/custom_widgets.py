@@ -1,9 +1,12 @@
 from __future__ import unicode_literals
+import asyncio
 import six
 from collections import deque
+import threading
 from typing import (
     List,
     Deque,
+    Optional,
 )
 
 from prompt_toolkit.auto_suggest import DynamicAutoSuggest
@@ -46,6 +49,9 @@ class CustomBuffer(Buffer):
 
 
 class CustomTextArea:
+    # Seconds between repaints of the logged text, log calls in between are rendered together.
+    REPAINT_INTERVAL = 0.05
+
     def __init__(self, text='', multiline=True, password=False,
                  lexer=None, auto_suggest=None, completer=None,
                  complete_while_typing=True, accept_handler=None, history=None,
@@ -132,7 +138,14 @@ class CustomTextArea:
             get_line_prefix=get_line_prefix,
             align=align)
 
-        self.log_lines: Deque[str] = deque()
+        # Ring buffer of the retained lines. Log calls, which can come from other threads, only append to it, and
+        # the document is rebuilt from it at most once per REPAINT_INTERVAL on the event loop.
+        self.log_lines: Deque[str] = deque(maxlen=max_line_count)
+        self._log_lock: threading.Lock = threading.Lock()
+        self._pending_lines: Optional[List[str]] = None
+        self._repaint_pending: bool = False
+        self._repaint_handle: Optional[asyncio.TimerHandle] = None
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
         self.log(initial_text)
 
     @property
@@ -193,12 +206,35 @@ class CustomTextArea:
                 line = line[max_width:]
             new_lines.append(line)
 
-        if save_log:
-            self.log_lines.extend(new_lines)
-            while len(self.log_lines) > self.max_line_count:
-                self.log_lines.popleft()
-            new_text: str = "\n".join(self.log_lines)
+        with self._log_lock:
+            if save_log:
+                if self.log_lines.maxlen != self.max_line_count:
+                    self.log_lines = deque(self.log_lines, maxlen=self.max_line_count)
+                self.log_lines.extend(new_lines)
+            if silent:
+                return
+            self._pending_lines = None if save_log else new_lines
+            if self._repaint_pending:
+                return
+            self._repaint_pending = True
+        if self._ev_loop.is_running():
+            self._ev_loop.call_soon_threadsafe(self._schedule_repaint)
         else:
-            new_text: str = "\n".join(new_lines)
-        if not silent:
-            self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+            self.repaint()
+
+    def _schedule_repaint(self):
+        if self._repaint_handle is None:
+            self._repaint_handle = self._ev_loop.call_later(self.REPAINT_INTERVAL, self.repaint)
+
+    def repaint(self):
+        """
+        Renders the lines logged since the last repaint: the retained lines, or only the new lines if the last log
+        call had save_log=False.
+        """
+        self._repaint_handle = None
+        with self._log_lock:
+            if not self._repaint_pending:
+                return
+            self._repaint_pending = False
+            new_text: str = "\n".join(self._pending_lines if self._pending_lines is not None else self.log_lines)
+        self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
@@ -6,6 +6,8 @@ cdef class ConnectorBase(NetworkIterator):
     cdef:
         EventReporter _event_reporter
         EventLogger _event_logger
+        dict _order_filled_balances
+        object _order_filled_forwarder
         public bint _trading_required
         public dict _account_available_balances
         public dict _account_balances
@@ -11,6 +11,7 @@ from hummingbot.core.event.events import (
     OrderType,
     TradeType
 )
+from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.network_iterator import NetworkIterator
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
@@ -37,15 +38,21 @@ cdef class ConnectorBase(NetworkIterator):
         MarketEvent.SellOrderCreated,
         MarketEvent.OrderExpired
     ]
+    # Number of events kept by the connector's event log, and per event type in its index.
+    EVENT_LOG_MAX_SIZE = 10000
 
     def __init__(self):
         super().__init__()
 
         self._event_reporter = EventReporter(event_source=self.display_name)
-        self._event_logger = EventLogger(event_source=self.display_name)
+        self._event_logger = EventLogger(event_source=self.display_name, max_events=self.EVENT_LOG_MAX_SIZE)
         for event_tag in self.MARKET_EVENTS:
             self.c_add_listener(event_tag.value, self._event_reporter)
             self.c_add_listener(event_tag.value, self._event_logger)
+        # Balance changes from all fills are kept as running totals, since the event log only keeps recent events.
+        self._order_filled_balances = {}
+        self._order_filled_forwarder = EventForwarder(self._update_order_filled_balances)
+        self.c_add_listener(MarketEvent.OrderFilled.value, self._order_filled_forwarder)
 
         self._account_balances = {}  # Dict[asset_name:str, Decimal]
         self._account_available_balances = {}  # Dict[asset_name:str, Decimal]
@@ -127,28 +134,36 @@ cdef class ConnectorBase(NetworkIterator):
         Calculates total asset balance changes from filled orders since the timestamp
         For BUY filled order, the quote balance goes down while the base balance goes up, and for SELL order, it's the
         opposite. This does not account for fee.
+        Without a starting timestamp, running totals over every fill since the connector was created are returned.
         :param starting_timestamp: The starting timestamp to include filter order filled events
         :returns A dictionary of tokens and their balance
         """
-        order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
-        order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
+        if starting_timestamp <= 0:
+            return self._order_filled_balances.copy()
         balances = {}
-        for event in order_filled_events:
-            base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
-            if event.trade_type is TradeType.BUY:
-                quote_value = Decimal("-1") * event.price * event.amount
-                base_value = event.amount
-            else:
-                quote_value = event.price * event.amount
-                base_value = Decimal("-1") * event.amount
-            if base not in balances:
-                balances[base] = s_decimal_0
-            if quote not in balances:
-                balances[quote] = s_decimal_0
-            balances[base] += base_value
-            balances[quote] += quote_value
+        for event in self._event_logger.events_of_type(OrderFilledEvent, starting_timestamp):
+            self._add_order_filled_balance(balances, event)
         return balances
 
+    def _update_order_filled_balances(self, event: OrderFilledEvent):
+        self._add_order_filled_balance(self._order_filled_balances, event)
+
+    @staticmethod
+    def _add_order_filled_balance(balances: Dict[str, Decimal], event: OrderFilledEvent):
+        base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
+        if event.trade_type is TradeType.BUY:
+            quote_value = Decimal("-1") * event.price * event.amount
+            base_value = event.amount
+        else:
+            quote_value = event.price * event.amount
+            base_value = Decimal("-1") * event.amount
+        if base not in balances:
+            balances[base] = s_decimal_0
+        if quote not in balances:
+            balances[quote] = s_decimal_0
+        balances[base] += base_value
+        balances[quote] += quote_value
+
     def get_exchange_limit_config(self, market: str) -> Dict[str, object]:
         """
         Retrieves the Balance Limits for the specified market.
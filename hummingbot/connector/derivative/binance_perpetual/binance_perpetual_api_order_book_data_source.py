@@ -1,18 +1,17 @@
 import asyncio
 import logging
 import time
-from typing import Dict, List, Optional, Any, AsyncIterable
+from typing import Dict, List, Optional, Any
 
 import aiohttp
 import pandas as pd
-import ujson
-import websockets
-from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.http_client import shared_client
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.websocket_stream_manager import WebsocketStreamManager
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_order_book import BinancePerpetualOrderBook
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import convert_to_exchange_trading_pair
@@ -32,6 +31,16 @@ EXCHANGE_INFO_URL = "{}/fapi/v1/exchangeInfo"
 RECENT_TRADES_URL = "{}/fapi/v1/trades"
 
 
+def diff_message_from_stream(msg: Dict[str, Any], recv_time: float) -> OrderBookMessage:
+    # Normalises @depth messages on the DecodePool, so it must stay a picklable module level function.
+    return BinancePerpetualOrderBook.diff_message_from_exchange(msg, recv_time)
+
+
+def trade_message_from_stream(msg: Dict[str, Any], recv_time: float) -> OrderBookMessage:
+    # Normalises @aggTrade messages on the DecodePool, so it must stay a picklable module level function.
+    return BinancePerpetualOrderBook.trade_message_from_exchange(msg)
+
+
 class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
     def __init__(self, trading_pairs: List[str] = None, domain: str = "binance_perpetual"):
         super().__init__(trading_pairs)
@@ -57,7 +66,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str, domain=None) -> float:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             url = TESTNET_BASE_URL if domain == "binance_perpetual_testnet" else PERPETUAL_BASE_URL
             resp = await client.get(f"{TICKER_PRICE_CHANGE_URL.format(url)}?symbol={convert_to_exchange_trading_pair(trading_pair)}")
             resp_json = await resp.json()
@@ -85,7 +94,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         try:
             from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import convert_from_exchange_trading_pair
             BASE_URL = TESTNET_BASE_URL if domain == "binance_perpetual_testnet" else PERPETUAL_BASE_URL
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 async with client.get(EXCHANGE_INFO_URL.format(BASE_URL), timeout=10) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -118,7 +127,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000, self._base_url)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = BinancePerpetualOrderBook.snapshot_message_from_exchange(
@@ -132,7 +141,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     """
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             trading_pairs: List[str] = await self.get_trading_pairs()
             return_val: Dict[str, OrderBookTrackerEntry] = {}
             for trading_pair in trading_pairs:
@@ -155,68 +164,27 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return return_val
     """
 
-    async def ws_messages(self, client: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
-        try:
-            while True:
-                try:
-                    raw_msg: str = await asyncio.wait_for(client.recv(), timeout=30.0)
-                    yield raw_msg
-                except asyncio.TimeoutError:
-                    await client.pong(data=b'')
-        except ConnectionClosed:
-            return
-        finally:
-            await client.close()
+    @property
+    def stream_manager(self) -> WebsocketStreamManager:
+        return WebsocketStreamManager.get_instance(self._stream_url)
 
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                # trading_pairs: List[str] = await self.get_trading_pairs()
-                ws_subscription_path: str = "/".join([f"{convert_to_exchange_trading_pair(trading_pair).lower()}@depth"
-                                                      for trading_pair in self._trading_pairs])
-                stream_url: str = f"{self._stream_url}?streams={ws_subscription_path}"
-                async with websockets.connect(stream_url) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self.ws_messages(ws):
-                        msg_json = ujson.loads(raw_msg)
-                        timestamp: float = time.time()
-                        order_book_message: OrderBookMessage = BinancePerpetualOrderBook.diff_message_from_exchange(
-                            msg_json,
-                            timestamp
-                        )
-                        output.put_nowait(order_book_message)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with Websocket connection. Retrying after 30 seconds... ",
-                                    exc_info=True)
-                await asyncio.sleep(30.0)
+        streams: List[str] = [f"{convert_to_exchange_trading_pair(trading_pair).lower()}@depth"
+                              for trading_pair in self._trading_pairs]
+        async for order_book_message in self.stream_manager.listen(streams, diff_message_from_stream):
+            output.put_nowait(order_book_message)
 
     async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                # trading_pairs: List[str] = await self.get_trading_pairs()
-                ws_subscription_path: str = "/".join([f"{convert_to_exchange_trading_pair(trading_pair).lower()}@aggTrade"
-                                                      for trading_pair in self._trading_pairs])
-                stream_url = f"{self._stream_url}?streams={ws_subscription_path}"
-                async with websockets.connect(stream_url) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self.ws_messages(ws):
-                        msg_json = ujson.loads(raw_msg)
-                        trade_msg: OrderBookMessage = BinancePerpetualOrderBook.trade_message_from_exchange(msg_json)
-                        output.put_nowait(trade_msg)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(30)
+        streams: List[str] = [f"{convert_to_exchange_trading_pair(trading_pair).lower()}@aggTrade"
+                              for trading_pair in self._trading_pairs]
+        async for trade_msg in self.stream_manager.listen(streams, trade_message_from_stream):
+            output.put_nowait(trade_msg)
 
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
                 # trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_client() as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, domain=self._base_url)
@@ -21,9 +21,6 @@ import hashlib
 import hmac
 import time
 import logging
-import ujson
-import websockets
-from websockets.exceptions import ConnectionClosed
 from decimal import Decimal
 from typing import Optional, List, Dict, Any, AsyncIterable
 from urllib.parse import urlencode
@@ -45,6 +42,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent, PositionSide, PositionMode, PositionAction)
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.utils.websocket_stream_manager import WebsocketStreamManager
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_order_book_tracker import BinancePerpetualOrderBookTracker
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_user_stream_tracker import BinancePerpetualUserStreamTracker
@@ -682,32 +680,18 @@ class BinancePerpetualDerivative(DerivativeBase):
                 await asyncio.sleep(0.5)
 
     async def _funding_info_polling_loop(self):
-        while True:
+        streams: List[str] = [f"{convert_to_exchange_trading_pair(trading_pair).lower()}@markPrice"
+                              for trading_pair in self._trading_pairs]
+        stream_manager: WebsocketStreamManager = WebsocketStreamManager.get_instance(f"{self._stream_url}/stream")
+        async for msg in stream_manager.listen(streams):
             try:
-                ws_subscription_path: str = "/".join([f"{convert_to_exchange_trading_pair(trading_pair).lower()}@markPrice"
-                                                      for trading_pair in self._trading_pairs])
-                stream_url: str = f"{self._stream_url}/stream?streams={ws_subscription_path}"
-                async with websockets.connect(stream_url) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    while True:
-                        try:
-                            raw_msg: str = await asyncio.wait_for(ws.recv(), timeout=10.0)
-                            msg = ujson.loads(raw_msg)
-                            trading_pair = convert_from_exchange_trading_pair(msg["data"]["s"])
-                            self._funding_info[trading_pair] = {"indexPrice": msg["data"]["i"],
-                                                                "markPrice": msg["data"]["p"],
-                                                                "nextFundingTime": msg["data"]["T"],
-                                                                "rate": msg["data"]["r"]}
-                        except asyncio.TimeoutError:
-                            await ws.pong(data=b'')
-                        except ConnectionClosed:
-                            raise
-            except asyncio.CancelledError:
-                raise
+                trading_pair = convert_from_exchange_trading_pair(msg["data"]["s"])
+                self._funding_info[trading_pair] = {"indexPrice": msg["data"]["i"],
+                                                    "markPrice": msg["data"]["p"],
+                                                    "nextFundingTime": msg["data"]["T"],
+                                                    "rate": msg["data"]["r"]}
             except Exception:
-                self.logger().error("Unexpected error updating funding info. Retrying after 10 seconds... ",
-                                    exc_info=True)
-                await asyncio.sleep(10.0)
+                self.logger().error(f"Unexpected error updating funding info from {msg}.", exc_info=True)
 
     async def _status_polling_loop(self):
         while True:
@@ -1,8 +1,8 @@
-import aiohttp
 from typing import List
 import json
 from typing import Dict
 
+from hummingbot.core.utils.http_client import shared_client
 from hummingbot.connector.derivative.perpetual_finance.perpetual_finance_utils import convert_from_exchange_trading_pair
 
 
@@ -10,7 +10,7 @@ class PerpetualFinanceAPIOrderBookDataSource:
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         url = "https://metadata.perp.exchange/production.json"
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             response = await client.get(url)
             trading_pairs = []
             parsed_response = json.loads(await response.text())
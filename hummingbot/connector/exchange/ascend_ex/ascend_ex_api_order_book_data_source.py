@@ -1,13 +1,13 @@
 #!/usr/bin/env python
 import asyncio
 import logging
-import aiohttp
 import websockets
 import ujson
 import time
 import pandas as pd
 
 from typing import Optional, List, Dict, Any, AsyncIterable
+from hummingbot.core.utils.http_client import shared_client
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -43,7 +43,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
         result = {}
 
         for trading_pair in trading_pairs:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 resp = await client.get(f"{REST_URL}/trades?symbol={convert_to_exchange_trading_pair(trading_pair)}")
                 if resp.status != 200:
                     raise IOError(
@@ -69,7 +69,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             resp = await client.get(f"{REST_URL}/ticker")
 
             if resp.status != 200:
@@ -84,7 +84,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Get whole orderbook
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             resp = await client.get(f"{REST_URL}/depth?symbol={convert_to_exchange_trading_pair(trading_pair)}")
             if resp.status != 200:
                 raise IOError(
@@ -3,10 +3,10 @@ import time
 import asyncio
 import logging
 import websockets
-import aiohttp
 import ujson
 
 from typing import Optional, List, AsyncIterable, Any
+from hummingbot.core.utils.http_client import get_shared_session
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_auth import AscendExAuth
@@ -50,7 +50,7 @@ class AscendExAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
         while True:
             try:
-                response = await aiohttp.ClientSession().get(f"{REST_URL}/info", headers={
+                response = await (await get_shared_session()).get(f"{REST_URL}/info", headers={
                     **self._ascend_ex_auth.get_headers(),
                     **self._ascend_ex_auth.get_auth_headers("info"),
                 })
@@ -13,6 +13,7 @@ import aiohttp
 import time
 from collections import namedtuple
 
+from hummingbot.core.utils.http_client import get_shared_session
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.clock import Clock
@@ -322,7 +323,7 @@ class AscendExExchange(ExchangeBase):
             **self._ascend_ex_auth.get_auth_headers("info"),
         }
         url = f"{REST_URL}/info"
-        response = await aiohttp.ClientSession().get(url, headers=headers)
+        response = await (await get_shared_session()).get(url, headers=headers)
 
         try:
             parsed_response = json.loads(await response.text())
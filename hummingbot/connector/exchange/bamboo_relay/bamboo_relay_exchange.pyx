@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 from async_timeout import timeout
 from collections import (
@@ -25,6 +24,7 @@ from libc.stdint cimport int64_t
 from web3 import Web3
 from web3.exceptions import TransactionNotFound
 
+from hummingbot.core.utils.http_client import shared_client
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book cimport OrderBook
@@ -942,7 +942,7 @@ cdef class BambooRelayExchange(ExchangeBase):
                            url: str,
                            data: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             async with client.request(http_method,
                                       url=url,
                                       timeout=self.API_CALL_TIMEOUT,
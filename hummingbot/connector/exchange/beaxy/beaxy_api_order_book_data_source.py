@@ -11,6 +11,7 @@ import websockets
 
 
 from websockets.exceptions import ConnectionClosed
+from hummingbot.core.utils.http_client import shared_client
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
@@ -47,7 +48,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     @async_ttl_cache(ttl=60 * 30, maxsize=1)
     async def get_active_exchange_markets(cls) -> pd.DataFrame:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
 
             symbols_response: aiohttp.ClientResponse = await client.get(BeaxyConstants.PublicApi.SYMBOLS_URL)
             rates_response: aiohttp.ClientResponse = await client.get(BeaxyConstants.PublicApi.RATES_URL)
@@ -98,7 +99,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> Optional[List[str]]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 async with client.get(BeaxyConstants.PublicApi.SYMBOLS_URL, timeout=5) as response:
                     if response.status == 200:
                         all_trading_pairs: List[Dict[str, Any]] = await response.json()
@@ -114,7 +115,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         async def last_price_for_pair(trading_pair):
             symbol = trading_pair_to_symbol(trading_pair)
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 async with client.get(BeaxyConstants.PublicApi.RATE_URL.format(symbol=symbol)) as response:
                     response: aiohttp.ClientResponse
                     if response.status != 200:
@@ -153,7 +154,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 20)
             snapshot_timestamp = snapshot['timestamp']
             snapshot_msg: OrderBookMessage = BeaxyOrderBook.snapshot_message_from_exchange(
@@ -168,7 +169,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return order_book
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             trading_pairs: Optional[List[str]] = await self.get_trading_pairs()
             assert trading_pairs is not None
             retval: Dict[str, OrderBookTrackerEntry] = {}
@@ -8,6 +8,7 @@ from datetime import datetime
 
 import aiohttp
 
+from hummingbot.core.utils.http_client import shared_client
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
 
@@ -86,7 +87,7 @@ class BeaxyAuth:
             start_time = monotonic()
             start_timestamp = datetime.now()
 
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 async with client.post(
                         f'{BeaxyConstants.TradingApi.BASE_URL}{BeaxyConstants.TradingApi.TOKEN_ENDPOINT}',
                         json={'api_key_id': self.api_key, 'api_secret': self.api_secret}
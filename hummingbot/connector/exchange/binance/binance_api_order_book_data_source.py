@@ -3,10 +3,8 @@
 import asyncio
 import aiohttp
 import logging
-import pandas as pd
 from typing import (
     Any,
-    AsyncIterable,
     Dict,
     List,
     Optional
@@ -14,13 +12,12 @@ from typing import (
 from decimal import Decimal
 import re
 import time
-import ujson
-import websockets
-from websockets.exceptions import ConnectionClosed
+from hummingbot.core.utils.http_client import shared_client
+from hummingbot.core.utils.websocket_stream_manager import WebsocketStreamManager
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
@@ -29,15 +26,22 @@ from hummingbot.connector.exchange.binance.binance_utils import convert_to_excha
 TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
 
 SNAPSHOT_REST_URL = "https://api.binance.{}/api/v1/depth"
-DIFF_STREAM_URL = "wss://stream.binance.{}:9443/ws"
+COMBINED_STREAM_URL = "wss://stream.binance.{}:9443/stream"
 TICKER_PRICE_CHANGE_URL = "https://api.binance.{}/api/v1/ticker/24hr"
 EXCHANGE_INFO_URL = "https://api.binance.{}/api/v1/exchangeInfo"
 
 
-class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
+def trade_message_from_stream(msg: Dict[str, Any], recv_time: float) -> OrderBookMessage:
+    # Normalises @trade messages on the DecodePool, so it must stay a picklable module level function.
+    return BinanceOrderBook.trade_message_from_exchange(msg["data"])
+
+
+def diff_message_from_stream(msg: Dict[str, Any], recv_time: float) -> NumpyOrderBookMessage:
+    # Normalises @depth messages on the DecodePool, so it must stay a picklable module level function.
+    return BinanceOrderBook.diff_message_from_exchange(msg["data"], recv_time)
 
-    MESSAGE_TIMEOUT = 30.0
-    PING_TIMEOUT = 10.0
+
+class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     _baobds_logger: Optional[HummingbotLogger] = None
 
@@ -60,7 +64,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str, domain: str = "com") -> float:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             url = TICKER_PRICE_CHANGE_URL.format(domain)
             resp = await client.get(f"{url}?symbol={convert_to_exchange_trading_pair(trading_pair)}")
             resp_json = await resp.json()
@@ -70,7 +74,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @async_ttl_cache(ttl=2, maxsize=1)
     async def get_all_mid_prices(domain="com") -> Optional[Decimal]:
         from hummingbot.connector.exchange.binance.binance_utils import convert_from_exchange_trading_pair
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             url = "https://api.binance.{}/api/v3/ticker/bookTicker".format(domain)
             resp = await client.get(url)
             resp_json = await resp.json()
@@ -84,7 +88,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def fetch_trading_pairs(domain="com") -> List[str]:
         try:
             from hummingbot.connector.exchange.binance.binance_utils import convert_from_exchange_trading_pair
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 url = EXCHANGE_INFO_URL.format(domain)
                 async with client.get(url, timeout=10) as response:
                     if response.status == 200:
@@ -123,113 +127,41 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
             return data
 
-    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+    async def get_snapshot_message(self, trading_pair: str) -> NumpyOrderBookMessage:
+        async with shared_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000, self._domain)
             snapshot_timestamp: float = time.time()
-            snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
+            return BinanceOrderBook.snapshot_message_from_exchange(
                 snapshot,
                 snapshot_timestamp,
                 metadata={"trading_pair": trading_pair}
             )
-            order_book = self.order_book_create_function()
-            order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-            return order_book
 
-    async def _inner_messages(self,
-                              ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
-        # Terminate the recv() loop as soon as the next message timed out, so the outer loop can reconnect.
-        try:
-            while True:
-                try:
-                    msg: str = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    yield msg
-                except asyncio.TimeoutError:
-                    try:
-                        pong_waiter = await ws.ping()
-                        await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
-                    except asyncio.TimeoutError:
-                        raise
-        except asyncio.TimeoutError:
-            self.logger().warning("WebSocket ping timed out. Going to reconnect...")
-            return
-        except ConnectionClosed:
-            return
-        finally:
-            await ws.close()
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        snapshot_msg: NumpyOrderBookMessage = await self.get_snapshot_message(trading_pair)
+        order_book = self.order_book_create_function()
+        order_book.apply_numpy_snapshot(snapshot_msg.bids_array, snapshot_msg.asks_array, snapshot_msg.update_id)
+        return order_book
+
+    @property
+    def stream_manager(self) -> WebsocketStreamManager:
+        return WebsocketStreamManager.get_instance(COMBINED_STREAM_URL.format(self._domain))
 
     async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                ws_path: str = "/".join([f"{convert_to_exchange_trading_pair(trading_pair).lower()}@trade"
-                                         for trading_pair in self._trading_pairs])
-                url = DIFF_STREAM_URL.format(self._domain)
-                stream_url: str = f"{url}/{ws_path}"
-
-                async with websockets.connect(stream_url) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
-                        trade_msg: OrderBookMessage = BinanceOrderBook.trade_message_from_exchange(msg)
-                        output.put_nowait(trade_msg)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(30.0)
+        streams: List[str] = [f"{convert_to_exchange_trading_pair(trading_pair).lower()}@trade"
+                              for trading_pair in self._trading_pairs]
+        async for trade_msg in self.stream_manager.listen(streams, trade_message_from_stream):
+            output.put_nowait(trade_msg)
 
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                ws_path: str = "/".join([f"{convert_to_exchange_trading_pair(trading_pair).lower()}@depth"
-                                         for trading_pair in self._trading_pairs])
-                url = DIFF_STREAM_URL.format(self._domain)
-                stream_url: str = f"{url}/{ws_path}"
-
-                async with websockets.connect(stream_url) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
-                        order_book_message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(
-                            msg, time.time())
-                        output.put_nowait(order_book_message)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(30.0)
+        streams: List[str] = [f"{convert_to_exchange_trading_pair(trading_pair).lower()}@depth"
+                              for trading_pair in self._trading_pairs]
+        async for order_book_message in self.stream_manager.listen(streams, diff_message_from_stream):
+            output.put_nowait(order_book_message)
 
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                async with aiohttp.ClientSession() as client:
-                    for trading_pair in self._trading_pairs:
-                        try:
-                            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair,
-                                                                               domain=self._domain)
-                            snapshot_timestamp: float = time.time()
-                            snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
-                                snapshot,
-                                snapshot_timestamp,
-                                metadata={"trading_pair": trading_pair}
-                            )
-                            output.put_nowait(snapshot_msg)
-                            self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                            # Be careful not to go above Binance's API rate limits.
-                            await asyncio.sleep(5.0)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception:
-                            self.logger().error("Unexpected error.", exc_info=True)
-                            await asyncio.sleep(5.0)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error.", exc_info=True)
-                await asyncio.sleep(5.0)
+        """
+        Order books are not refreshed periodically. BinanceOrderBookTracker checks the continuity of the diff update
+        ids, and requests a snapshot through get_snapshot_message() for a book that missed a diff.
+        """
+        pass
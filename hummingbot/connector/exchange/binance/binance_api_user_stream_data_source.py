@@ -3,14 +3,12 @@
 import asyncio
 import aiohttp
 import logging
-import time
 from typing import (
-    AsyncIterable,
     Dict,
     Optional
 )
-import ujson
-import websockets
+from hummingbot.core.utils.http_client import shared_client
+from hummingbot.core.utils.websocket_stream_manager import WebsocketStreamManager
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from binance.client import Client as BinanceClient
@@ -18,14 +16,11 @@ from hummingbot.logger import HummingbotLogger
 
 BINANCE_API_ENDPOINT = "https://api.binance.{}/api/v1/"
 BINANCE_USER_STREAM_ENDPOINT = "userDataStream"
-BINANCE_WSS_USER_STREAM = "wss://stream.binance.{}:9443/ws/"
+BINANCE_COMBINED_STREAM = "wss://stream.binance.{}:9443/stream"
 
 
 class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
-    MESSAGE_TIMEOUT = 30.0
-    PING_TIMEOUT = 10.0
-
     _bausds_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -38,16 +33,21 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
         self._binance_client: BinanceClient = binance_client
         self._current_listen_key = None
         self._listen_for_user_stream_task = None
-        self._last_recv_time: float = 0
         self._domain = domain
         super().__init__()
 
+    @property
+    def stream_manager(self) -> WebsocketStreamManager:
+        return WebsocketStreamManager.get_instance(BINANCE_COMBINED_STREAM.format(self._domain))
+
     @property
     def last_recv_time(self) -> float:
-        return self._last_recv_time
+        if self._current_listen_key is None:
+            return 0
+        return self.stream_manager.last_recv_time(self._current_listen_key)
 
     async def get_listen_key(self):
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             url = BINANCE_API_ENDPOINT.format(self._domain)
             async with client.post(f"{url}{BINANCE_USER_STREAM_ENDPOINT}",
                                    headers={"X-MBX-APIKEY": self._binance_client.API_KEY}) as response:
@@ -58,7 +58,7 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 return data["listenKey"]
 
     async def ping_listen_key(self, listen_key: str) -> bool:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             url = BINANCE_API_ENDPOINT.format(self._domain)
             async with client.put(f"{url}{BINANCE_USER_STREAM_ENDPOINT}",
                                   headers={"X-MBX-APIKEY": self._binance_client.API_KEY},
@@ -69,42 +69,6 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     return False
                 return True
 
-    async def _inner_messages(self, ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
-        # Terminate the recv() loop as soon as the next message timed out, so the outer loop can reconnect.
-        try:
-            while True:
-                try:
-                    msg: str = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    self._last_recv_time = time.time()
-                    yield msg
-                except asyncio.TimeoutError:
-                    try:
-                        pong_waiter = await ws.ping()
-                        await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
-                        self._last_recv_time = time.time()
-                    except asyncio.TimeoutError:
-                        raise
-        except asyncio.TimeoutError:
-            self.logger().warning("WebSocket ping timed out. Going to reconnect...")
-            return
-        except websockets.exceptions.ConnectionClosed:
-            return
-        finally:
-            await ws.close()
-
-    async def messages(self) -> AsyncIterable[str]:
-        async with (await self.get_ws_connection()) as ws:
-            async for msg in self._inner_messages(ws):
-                yield msg
-
-    async def get_ws_connection(self) -> websockets.WebSocketClientProtocol:
-        url = BINANCE_WSS_USER_STREAM.format(self._domain)
-        stream_url: str = f"{url}{self._current_listen_key}"
-        self.logger().info(f"Reconnecting to {stream_url}.")
-
-        # Create the WS connection.
-        return websockets.connect(stream_url)
-
     async def listen_for_user_stream(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         try:
             while True:
@@ -141,13 +105,5 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
             self._current_listen_key = None
 
     async def log_user_stream(self, output: asyncio.Queue):
-        while True:
-            try:
-                async for message in self.messages():
-                    decoded: Dict[str, any] = ujson.loads(message)
-                    output.put_nowait(decoded)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error. Retrying after 5 seconds...", exc_info=True)
-                await asyncio.sleep(5.0)
+        async for msg in self.stream_manager.listen([self._current_listen_key]):
+            output.put_nowait(msg["data"])
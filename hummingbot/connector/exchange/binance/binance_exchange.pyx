@@ -1,7 +1,6 @@
 from traceback import format_exc
 from collections import defaultdict
 from libc.stdint cimport int64_t
-import aiohttp
 from aiokafka import (
     AIOKafkaConsumer,
     ConsumerRecord
@@ -23,10 +22,16 @@ from typing import (
     AsyncIterable,
     Optional,
     Coroutine,
+    Set,
 )
 
 import conf
-from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.utils.http_client import shared_client
+from hummingbot.core.utils.asyncio_throttle import (
+    DEFAULT_LIMIT_ID,
+    TaskPriority,
+    Throttler,
+)
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.clock cimport Clock
@@ -52,6 +57,7 @@ from hummingbot.core.event.events import (
     TradeFee
 )
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.rest_polling_tracker import RestPollingTracker
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.cancellation_result import CancellationResult
@@ -65,7 +71,13 @@ from .binance_time import BinanceTime
 from .binance_in_flight_order import BinanceInFlightOrder
 from .binance_utils import (
     convert_from_exchange_trading_pair,
-    convert_to_exchange_trading_pair)
+    convert_to_exchange_trading_pair,
+    lists_open_orders_per_trading_pair,
+    ALL_OPEN_ORDERS_LIMIT_ID,
+    MY_TRADES_LIMIT_ID,
+    OPEN_ORDERS_LIMIT_ID,
+    ORDER_LIMIT_ID,
+    RATE_LIMITS)
 from hummingbot.core.data_type.common import OpenOrder
 from hummingbot.core.data_type.trade import Trade
 s_logger = None
@@ -151,7 +163,8 @@ cdef class BinanceExchange(ExchangeBase):
         self._trading_rules_polling_task = None
         self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
         self._last_poll_timestamp = 0
-        self._throttler = Throttler((10.0, 1.0))
+        self._throttler = Throttler(rate_limits=RATE_LIMITS)
+        self._rest_polling_tracker = RestPollingTracker()
 
     @property
     def name(self) -> str:
@@ -225,8 +238,10 @@ cdef class BinanceExchange(ExchangeBase):
             *args,
             app_warning_msg: str = "Binance API call failed. Check API key and network connection.",
             request_weight: int = 1,
+            limit_id: str = DEFAULT_LIMIT_ID,
+            priority: TaskPriority = TaskPriority.NORMAL,
             **kwargs) -> Dict[str, any]:
-        async with self._throttler.weighted_task(request_weight=request_weight):
+        async with self._throttler.weighted_task(request_weight=request_weight, limit_id=limit_id, priority=priority):
             try:
                 return await self._async_scheduler.call_async(partial(func, *args, **kwargs),
                                                               timeout_seconds=self.API_CALL_TIMEOUT,
@@ -242,7 +257,7 @@ cdef class BinanceExchange(ExchangeBase):
 
     async def query_url(self, url, request_weight: int = 1) -> any:
         async with self._throttler.weighted_task(request_weight=request_weight):
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
                     if response.status != 200:
                         raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
@@ -383,7 +398,75 @@ cdef class BinanceExchange(ExchangeBase):
                 self.logger().error(f"Error parsing the trading pair rule {rule}. Skipping.", exc_info=True)
         return retval
 
-    async def _update_order_fills_from_trades(self):
+    async def _poll_trades(self, trading_pairs: List[str]) -> List[str]:
+        # Fetches the trades of each trading pair since the last trade id seen on it, applies those of in flight
+        # orders, and records those missing from the local history. Returns the trading pairs polled successfully.
+        polled_trading_pairs = []
+        tasks = []
+        for trading_pair in trading_pairs:
+            params = {"symbol": convert_to_exchange_trading_pair(trading_pair)}
+            last_trade_id = self._rest_polling_tracker.last_trade_id(trading_pair)
+            if last_trade_id is not None:
+                params["fromId"] = last_trade_id + 1
+            tasks.append(self.query_api(self._binance_client.get_my_trades,
+                                        limit_id=MY_TRADES_LIMIT_ID,
+                                        priority=TaskPriority.LOW,
+                                        **params))
+        self.logger().debug(f"Polling for order fills of {len(tasks)} trading pairs.")
+        results = await safe_gather(*tasks, return_exceptions=True)
+        order_map = {o.exchange_order_id: o for o in self._in_flight_orders.values()}
+        for trades, trading_pair in zip(results, trading_pairs):
+            if isinstance(trades, Exception):
+                self.logger().network(
+                    f"Error fetching trades update for the order {trading_pair}: {trades}.",
+                    app_warning_msg=f"Failed to fetch trade update for {trading_pair}."
+                )
+                continue
+            for trade in trades:
+                order_id = str(trade["orderId"])
+                tracked_order = order_map.get(order_id)
+                if tracked_order is not None:
+                    if tracked_order.update_with_trade_update(trade):
+                        self.c_trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG,
+                                             OrderFilledEvent(
+                                                 self._current_timestamp,
+                                                 tracked_order.client_order_id,
+                                                 tracked_order.trading_pair,
+                                                 tracked_order.trade_type,
+                                                 tracked_order.order_type,
+                                                 Decimal(trade["price"]),
+                                                 Decimal(trade["qty"]),
+                                                 TradeFee(
+                                                     percent=Decimal(0.0),
+                                                     flat_fees=[(trade["commissionAsset"],
+                                                                 Decimal(trade["commission"]))]
+                                                 ),
+                                                 exchange_trade_id=trade["id"]
+                                             ))
+                elif self.is_confirmed_new_order_filled_event(str(trade["id"]), order_id, trading_pair):
+                    self.c_trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG,
+                                         OrderFilledEvent(
+                                             trade["time"],
+                                             self._exchange_order_ids.get(order_id,
+                                                                          get_client_order_id("buy" if trade["isBuyer"] else "sell", trading_pair)),
+                                             trading_pair,
+                                             TradeType.BUY if trade["isBuyer"] else TradeType.SELL,
+                                             OrderType.LIMIT_MAKER,  # defaulting to this value since trade info lacks field
+                                             Decimal(trade["price"]),
+                                             Decimal(trade["qty"]),
+                                             TradeFee(
+                                                 percent=Decimal(0.0),
+                                                 flat_fees=[(trade["commissionAsset"],
+                                                             Decimal(trade["commission"]))]
+                                             ),
+                                             exchange_trade_id=trade["id"]
+                                         ))
+                    self.logger().info(f"Recreating missing trade in TradeFill: {trade}")
+            self._rest_polling_tracker.update_last_trade_id(trading_pair, [trade["id"] for trade in trades])
+            polled_trading_pairs.append(trading_pair)
+        return polled_trading_pairs
+
+    async def _update_order_fills_from_trades(self) -> List[str]:
         cdef:
             # This is intended to be a backup measure to get filled events with trade ID for orders,
             # in case Binance's user stream events are not working.
@@ -393,50 +476,15 @@ cdef class BinanceExchange(ExchangeBase):
             int64_t last_tick = <int64_t>(self._last_poll_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
             int64_t current_tick = <int64_t>(self._current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
 
-        if current_tick > last_tick:
-            if len(self._in_flight_orders) > 0:
-                trading_pairs_to_order_map = defaultdict(lambda: {})
-                for o in self._in_flight_orders.values():
-                    trading_pairs_to_order_map[o.trading_pair][o.exchange_order_id] = o
-
-                trading_pairs = list(trading_pairs_to_order_map.keys())
-                tasks = [self.query_api(self._binance_client.get_my_trades, symbol=convert_to_exchange_trading_pair(trading_pair))
-                         for trading_pair in trading_pairs]
-                self.logger().debug(f"Polling for order fills of {len(tasks)} trading pairs.")
-                results = await safe_gather(*tasks, return_exceptions=True)
-                for trades, trading_pair in zip(results, trading_pairs):
-                    order_map = trading_pairs_to_order_map[trading_pair]
-                    if isinstance(trades, Exception):
-                        self.logger().network(
-                            f"Error fetching trades update for the order {trading_pair}: {trades}.",
-                            app_warning_msg=f"Failed to fetch trade update for {trading_pair}."
-                        )
-                        continue
-                    for trade in trades:
-                        order_id = str(trade["orderId"])
-                        if order_id in order_map:
-                            tracked_order = order_map[order_id]
-                            order_type = tracked_order.order_type
-                            applied_trade = order_map[order_id].update_with_trade_update(trade)
-                            if applied_trade:
-                                self.c_trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG,
-                                                     OrderFilledEvent(
-                                                         self._current_timestamp,
-                                                         tracked_order.client_order_id,
-                                                         tracked_order.trading_pair,
-                                                         tracked_order.trade_type,
-                                                         order_type,
-                                                         Decimal(trade["price"]),
-                                                         Decimal(trade["qty"]),
-                                                         TradeFee(
-                                                             percent=Decimal(0.0),
-                                                             flat_fees=[(trade["commissionAsset"],
-                                                                         Decimal(trade["commission"]))]
-                                                         ),
-                                                         exchange_trade_id=trade["id"]
-                                                     ))
-
-    async def _history_reconciliation(self):
+        if current_tick > last_tick and len(self._in_flight_orders) > 0:
+            trading_pairs = list(dict.fromkeys(o.trading_pair for o in self._in_flight_orders.values()))
+            trading_pairs = self._rest_polling_tracker.trading_pairs_to_poll(
+                trading_pairs, time.time(), self._user_stream_tracker.last_recv_time)
+            if len(trading_pairs) > 0:
+                return await self._poll_trades(trading_pairs)
+        return []
+
+    async def _history_reconciliation(self) -> List[str]:
         cdef:
             # Method looks in the exchange history to check for any missing trade in local history.
             # If found, it will trigger an order_filled event to record it in local DB.
@@ -445,54 +493,57 @@ cdef class BinanceExchange(ExchangeBase):
             int64_t current_tick = <int64_t>(self._current_timestamp / self.LONG_POLL_INTERVAL)
 
         if current_tick > last_tick:
-            trading_pairs = self._order_book_tracker._trading_pairs
-            tasks = [self.query_api(self._binance_client.get_my_trades, symbol=convert_to_exchange_trading_pair(trading_pair))
-                     for trading_pair in trading_pairs]
-            self.logger().debug(f"Polling for order fills of {len(tasks)} trading pairs.")
-            exchange_history = await safe_gather(*tasks, return_exceptions=True)
-            for trades, trading_pair in zip(exchange_history, trading_pairs):
-                if isinstance(trades, Exception):
-                    self.logger().network(
-                        f"Error fetching trades update for the order {trading_pair}: {trades}.",
-                        app_warning_msg=f"Failed to fetch trade update for {trading_pair}."
-                    )
-                    continue
-                for trade in trades:
-                    if self.is_confirmed_new_order_filled_event(str(trade["id"]), str(trade["orderId"]), trading_pair):
-                        # Should check if this is a partial filling of a in_flight order.
-                        # In that case, user_stream or _update_order_fills_from_trades will take care when fully filled.
-                        if not any(trade["id"] in in_flight_order.trade_id_set for in_flight_order in self._in_flight_orders.values()):
-                            self.c_trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG,
-                                                 OrderFilledEvent(
-                                                     trade["time"],
-                                                     self._exchange_order_ids.get(str(trade["orderId"]),
-                                                                                  get_client_order_id("buy" if trade["isBuyer"] else "sell", trading_pair)),
-                                                     trading_pair,
-                                                     TradeType.BUY if trade["isBuyer"] else TradeType.SELL,
-                                                     OrderType.LIMIT_MAKER,  # defaulting to this value since trade info lacks field
-                                                     Decimal(trade["price"]),
-                                                     Decimal(trade["qty"]),
-                                                     TradeFee(
-                                                         percent=Decimal(0.0),
-                                                         flat_fees=[(trade["commissionAsset"],
-                                                                     Decimal(trade["commission"]))]
-                                                     ),
-                                                     exchange_trade_id=trade["id"]
-                                                 ))
-                            self.logger().info(f"Recreating missing trade in TradeFill: {trade}")
+            trading_pairs = self._rest_polling_tracker.trading_pairs_to_poll(
+                self._order_book_tracker._trading_pairs, time.time(), self._user_stream_tracker.last_recv_time)
+            if len(trading_pairs) > 0:
+                return await self._poll_trades(trading_pairs)
+        return []
+
+    async def _get_open_order_ids(self, trading_pairs: List[str]) -> Set[str]:
+        # Lists the open orders of each trading pair, or of all trading pairs at once when that weighs less.
+        if lists_open_orders_per_trading_pair(len(trading_pairs)):
+            results = await safe_gather(*[self.query_api(self._binance_client.get_open_orders,
+                                                         symbol=convert_to_exchange_trading_pair(trading_pair),
+                                                         limit_id=OPEN_ORDERS_LIMIT_ID,
+                                                         priority=TaskPriority.LOW)
+                                          for trading_pair in trading_pairs])
+            open_orders = [order for orders in results for order in orders]
+        else:
+            open_orders = await self.query_api(self._binance_client.get_open_orders,
+                                               limit_id=ALL_OPEN_ORDERS_LIMIT_ID,
+                                               priority=TaskPriority.LOW)
+        return {str(order["orderId"]) for order in open_orders}
 
-    async def _update_order_status(self):
+    async def _update_order_status(self) -> Set[str]:
         cdef:
             # This is intended to be a backup measure to close straggler orders, in case Binance's user stream events
-            # are not working.
+            # are not working. Returns the trading pairs whose order status could not be fetched.
             # The minimum poll interval for order status is 10 seconds.
             int64_t last_tick = <int64_t>(self._last_poll_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
             int64_t current_tick = <int64_t>(self._current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
+            set failed_trading_pairs = set()
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
-            tracked_orders = list(self._in_flight_orders.values())
+            trading_pairs = list(dict.fromkeys(o.trading_pair for o in self._in_flight_orders.values()))
+            trading_pairs = set(self._rest_polling_tracker.trading_pairs_to_poll(
+                trading_pairs, time.time(), self._user_stream_tracker.last_recv_time))
+            tracked_orders = [o for o in self._in_flight_orders.values() if o.trading_pair in trading_pairs]
+            if len(tracked_orders) == 0:
+                return failed_trading_pairs
+            # Orders still open need no update, only the others have their status requested one by one.
+            try:
+                open_order_ids = await self._get_open_order_ids(list(trading_pairs))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger().network(f"Error fetching open orders: {e}.",
+                                      app_warning_msg="Failed to fetch open orders.")
+                return trading_pairs
+            tracked_orders = self._rest_polling_tracker.orders_not_open(tracked_orders, open_order_ids)
             tasks = [self.query_api(self._binance_client.get_order,
-                                    symbol=convert_to_exchange_trading_pair(o.trading_pair), origClientOrderId=o.client_order_id)
+                                    symbol=convert_to_exchange_trading_pair(o.trading_pair), origClientOrderId=o.client_order_id,
+                                    limit_id=ORDER_LIMIT_ID,
+                                    priority=TaskPriority.LOW)
                      for o in tracked_orders]
             self.logger().debug(f"Polling for order status updates of {len(tasks)} orders.")
             results = await safe_gather(*tasks, return_exceptions=True)
@@ -517,6 +568,7 @@ cdef class BinanceExchange(ExchangeBase):
                         )
                         self.c_stop_tracking_order(client_order_id)
                     else:
+                        failed_trading_pairs.add(tracked_order.trading_pair)
                         self.logger().network(
                             f"Error fetching status update for the order {client_order_id}: {order_update}.",
                             app_warning_msg=f"Failed to fetch status update for the order {client_order_id}."
@@ -578,6 +630,7 @@ cdef class BinanceExchange(ExchangeBase):
                                                      order_type
                                                  ))
                     self.c_stop_tracking_order(client_order_id)
+        return failed_trading_pairs
 
     async def _iter_kafka_messages(self, topic: str) -> AsyncIterable[ConsumerRecord]:
         while True:
@@ -629,6 +682,7 @@ cdef class BinanceExchange(ExchangeBase):
                     else:
                         client_order_id = event_message.get("C")
 
+                    self._rest_polling_tracker.did_receive_order_update(client_order_id)
                     tracked_order = self._in_flight_orders.get(client_order_id)
 
                     if tracked_order is None:
@@ -717,12 +771,17 @@ cdef class BinanceExchange(ExchangeBase):
             try:
                 self._poll_notifier = asyncio.Event()
                 await self._poll_notifier.wait()
-                await safe_gather(
+                poll_timestamp = time.time()
+                _, polled_trading_pairs = await safe_gather(
                     self._update_balances(),
                     self._update_order_fills_from_trades()
                 )
-                await self._history_reconciliation()
-                await self._update_order_status()
+                polled_trading_pairs += await self._history_reconciliation()
+                failed_trading_pairs = await self._update_order_status()
+                # A trading pair is reconciled with the exchange once both its trades and its order status are polled.
+                for trading_pair in polled_trading_pairs:
+                    if trading_pair not in failed_trading_pairs:
+                        self._rest_polling_tracker.did_poll(trading_pair, poll_timestamp)
                 self._last_poll_timestamp = self._current_timestamp
             except asyncio.CancelledError:
                 raise
@@ -938,7 +997,8 @@ cdef class BinanceExchange(ExchangeBase):
         try:
             cancel_result = await self.query_api(self._binance_client.cancel_order,
                                                  symbol=convert_to_exchange_trading_pair(trading_pair),
-                                                 origClientOrderId=order_id)
+                                                 origClientOrderId=order_id,
+                                                 priority=TaskPriority.HIGH)
         except BinanceAPIException as e:
             if "Unknown order sent" in e.message or e.code == 2011:
                 # The order was never there to begin with. So cancelling it is a no-op but semantically successful.
@@ -1019,10 +1079,12 @@ cdef class BinanceExchange(ExchangeBase):
             price=price,
             amount=amount
         )
+        self._rest_polling_tracker.did_start_tracking_order(order_id, trading_pair)
 
     cdef c_stop_tracking_order(self, str order_id):
         if order_id in self._in_flight_orders:
             del self._in_flight_orders[order_id]
+        self._rest_polling_tracker.did_stop_tracking_order(order_id)
         if order_id in self._order_not_found_records:
             del self._order_not_found_records[order_id]
 
@@ -1086,7 +1148,7 @@ cdef class BinanceExchange(ExchangeBase):
         return self.c_get_order_book(trading_pair)
 
     async def get_open_orders(self) -> List[OpenOrder]:
-        orders = await self.query_api(self._binance_client.get_open_orders)
+        orders = await self.query_api(self._binance_client.get_open_orders, limit_id=ALL_OPEN_ORDERS_LIMIT_ID)
         ret_val = []
         for order in orders:
             if BROKER_ID not in order["clientOrderId"]:
@@ -1111,7 +1173,8 @@ cdef class BinanceExchange(ExchangeBase):
     async def get_all_my_trades(self, trading_pair: str) -> List[Trade]:
         # Ths Binance API call rate is 5, so we cache to make sure we don't go over rate limit
         trades = await self.query_api(self._binance_client.get_my_trades,
-                                      symbol=convert_to_exchange_trading_pair(trading_pair))
+                                      symbol=convert_to_exchange_trading_pair(trading_pair),
+                                      limit_id=MY_TRADES_LIMIT_ID)
         from hummingbot.connector.exchange.binance.binance_helper import format_trades
         return format_trades(trades)
 
@@ -13,6 +13,7 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.order_book_message import (
+    NumpyOrderBookMessage,
     OrderBookMessage,
     OrderBookMessageType
 )
@@ -33,30 +34,30 @@ cdef class BinanceOrderBook(OrderBook):
     def snapshot_message_from_exchange(cls,
                                        msg: Dict[str, any],
                                        timestamp: float,
-                                       metadata: Optional[Dict] = None) -> OrderBookMessage:
+                                       metadata: Optional[Dict] = None) -> NumpyOrderBookMessage:
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
-            "trading_pair": msg["trading_pair"],
-            "update_id": msg["lastUpdateId"],
-            "bids": msg["bids"],
-            "asks": msg["asks"]
-        }, timestamp=timestamp)
+        return NumpyOrderBookMessage.from_exchange_rows(OrderBookMessageType.SNAPSHOT,
+                                                        msg["trading_pair"],
+                                                        msg["lastUpdateId"],
+                                                        msg["bids"],
+                                                        msg["asks"],
+                                                        timestamp=timestamp)
 
     @classmethod
     def diff_message_from_exchange(cls,
                                    msg: Dict[str, any],
                                    timestamp: Optional[float] = None,
-                                   metadata: Optional[Dict] = None) -> OrderBookMessage:
+                                   metadata: Optional[Dict] = None) -> NumpyOrderBookMessage:
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.DIFF, {
-            "trading_pair": binance_utils.convert_from_exchange_trading_pair(msg["s"]),
-            "first_update_id": msg["U"],
-            "update_id": msg["u"],
-            "bids": msg["b"],
-            "asks": msg["a"]
-        }, timestamp=timestamp)
+        return NumpyOrderBookMessage.from_exchange_rows(OrderBookMessageType.DIFF,
+                                                        binance_utils.convert_from_exchange_trading_pair(msg["s"]),
+                                                        msg["u"],
+                                                        msg["b"],
+                                                        msg["a"],
+                                                        timestamp=timestamp,
+                                                        first_update_id=msg["U"])
 
     @classmethod
     def snapshot_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
@@ -140,5 +141,8 @@ cdef class BinanceOrderBook(OrderBook):
     @classmethod
     def from_snapshot(cls, msg: OrderBookMessage) -> "OrderBook":
         retval = BinanceOrderBook()
-        retval.apply_snapshot(msg.bids, msg.asks, msg.update_id)
+        if isinstance(msg, NumpyOrderBookMessage):
+            retval.apply_numpy_snapshot(msg.bids_array, msg.asks_array, msg.update_id)
+        else:
+            retval.apply_snapshot(msg.bids, msg.asks, msg.update_id)
         return retval
@@ -5,12 +5,54 @@ from typing import (
 
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.config_methods import using_exchange
+from hummingbot.core.utils.asyncio_throttle import (
+    DEFAULT_LIMIT_ID,
+    LinkedLimitWeight,
+    RateLimit,
+)
 
 
 CENTRALIZED = True
 EXAMPLE_PAIR = "ZRX-ETH"
 DEFAULT_FEES = [0.1, 0.1]
 
+REQUEST_WEIGHT_LIMIT_ID = "REQUEST_WEIGHT"
+ORDER_LIMIT_ID = "GET_ORDER"
+OPEN_ORDERS_LIMIT_ID = "GET_OPEN_ORDERS"
+ALL_OPEN_ORDERS_LIMIT_ID = "GET_ALL_OPEN_ORDERS"
+MY_TRADES_LIMIT_ID = "GET_MY_TRADES"
+
+ORDER_REQUEST_WEIGHT = 2
+OPEN_ORDERS_REQUEST_WEIGHT = 3
+ALL_OPEN_ORDERS_REQUEST_WEIGHT = 40
+MY_TRADES_REQUEST_WEIGHT = 10
+
+
+def _endpoint_rate_limit(limit_id: str, request_weight: int) -> RateLimit:
+    # Each call to the endpoint is paced as one request of the default limit, and counts its Binance request weight
+    # against the per-minute weight pool.
+    return RateLimit(limit_id, 1200, 60.0, linked_limits=[LinkedLimitWeight(DEFAULT_LIMIT_ID),
+                                                          LinkedLimitWeight(REQUEST_WEIGHT_LIMIT_ID, request_weight)])
+
+
+# Requests are paced at 10 per second, and also counted against Binance's 1200 request weight per minute.
+RATE_LIMITS = [
+    RateLimit(REQUEST_WEIGHT_LIMIT_ID, 1200, 60.0),
+    RateLimit(DEFAULT_LIMIT_ID, 10, 1.0, linked_limits=[LinkedLimitWeight(REQUEST_WEIGHT_LIMIT_ID)]),
+    _endpoint_rate_limit(ORDER_LIMIT_ID, ORDER_REQUEST_WEIGHT),
+    _endpoint_rate_limit(OPEN_ORDERS_LIMIT_ID, OPEN_ORDERS_REQUEST_WEIGHT),
+    _endpoint_rate_limit(ALL_OPEN_ORDERS_LIMIT_ID, ALL_OPEN_ORDERS_REQUEST_WEIGHT),
+    _endpoint_rate_limit(MY_TRADES_LIMIT_ID, MY_TRADES_REQUEST_WEIGHT),
+]
+
+
+def lists_open_orders_per_trading_pair(trading_pair_count: int) -> bool:
+    """
+    Whether listing the open orders of each trading pair weighs less than listing those of all trading pairs at once.
+    """
+    return trading_pair_count * OPEN_ORDERS_REQUEST_WEIGHT < ALL_OPEN_ORDERS_REQUEST_WEIGHT
+
+
 RE_4_LETTERS_QUOTE = re.compile(r"^(\w{3,})(USDT|USDC|USDS|TUSD|BUSD|IDRT|BKRW|BIDR|BVND)$")
 RE_3_LETTERS_QUOTE = re.compile(r"^(\w+)(\w{3})$")
 
@@ -2,9 +2,9 @@
 import asyncio
 import logging
 import time
-import aiohttp
 import traceback
 import pandas as pd
+from hummingbot.core.utils.http_client import shared_client
 import hummingbot.connector.exchange.digifinex.digifinex_constants as constants
 
 from typing import Optional, List, Dict, Any
@@ -41,7 +41,7 @@ class DigifinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         result = {}
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             resp = await client.get(f"{constants.REST_URL}/ticker")
             resp_json = await resp.json()
             for t_pair in trading_pairs:
@@ -53,7 +53,7 @@ class DigifinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             async with client.get(f"{constants.REST_URL}/ticker", timeout=10) as response:
                 if response.status == 200:
                     from hummingbot.connector.exchange.digifinex.digifinex_utils import \
@@ -71,7 +71,7 @@ class DigifinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Get whole orderbook
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             orderbook_response = await client.get(
                 f"{constants.REST_URL}/order_book?limit=150&symbol="
                 f"{digifinex_utils.convert_to_exchange_trading_pair(trading_pair)}"
@@ -10,6 +10,7 @@ from typing import (
     # Optional
 )
 
+from hummingbot.core.utils.http_client import shared_client
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
 TOKEN_CONFIGURATIONS_URL = 'https://api.dydx.exchange/v2/markets'
@@ -36,7 +37,7 @@ class DydxAPITokenConfigurationDataSource():
         return configuration_data_source
 
     async def _configure(self):
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             response: aiohttp.ClientResponse = await client.get(
                 f"{TOKEN_CONFIGURATIONS_URL}"
             )
@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 import random
 import re
@@ -10,6 +9,7 @@ from typing import (
     Tuple,
 )
 
+from hummingbot.core.utils.http_client import get_shared_session
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.config_methods import using_exchange
@@ -137,13 +137,11 @@ async def api_call_with_retries(method,
                                 try_count: int = 0) -> Dict[str, Any]:
     url = f"{Constants.REST_URL}/{endpoint}"
     headers = {"Content-Type": "application/json"}
-    http_client = shared_client if shared_client is not None else aiohttp.ClientSession()
+    http_client = shared_client if shared_client is not None else await get_shared_session()
     # Build request coro
     response_coro = http_client.request(method=method.upper(), url=url, headers=headers,
                                         params=params, timeout=Constants.API_CALL_TIMEOUT)
     http_status, parsed_response, request_errors = await aiohttp_response_with_errors(response_coro)
-    if shared_client is None:
-        await http_client.close()
     if request_errors or parsed_response is None:
         if try_count < Constants.API_MAX_RETRIES:
             try_count += 1